@@ -220,6 +220,47 @@ class KodiLibrary(object):
             i = index_list[0]
             return self.database[i].get(info)
 
+    @property
+    def uid_dbid_lookup(self):
+        """
+        Maps of imdb/tmdb/tvdb id to dbid built in one pass over the database
+        Keeps the first item for each id to match the index_list[0] result of _get_info
+        """
+        try:
+            return self._uid_dbid_lookup
+        except AttributeError:
+            imdb_lookup, tmdb_lookup, tvdb_lookup = {}, {}, {}
+            for item in self.database or ():
+                dbid = item.get('dbid')
+                if item.get('imdb_id') is not None:
+                    imdb_lookup.setdefault(item['imdb_id'], dbid)
+                if item.get('tmdb_id') is not None:
+                    tmdb_lookup.setdefault(item['tmdb_id'], dbid)
+                if item.get('tvdb_id') is not None:
+                    tvdb_lookup.setdefault(item['tvdb_id'], dbid)
+            self._uid_dbid_lookup = (imdb_lookup, tmdb_lookup, tvdb_lookup)
+            return self._uid_dbid_lookup
+
+    def get_info_bulk(self, tmdb_ids, tvdb_ids, imdb_ids):
+        """
+        Bulk equivalent of get_info(info='dbid', ...) matching by ids only
+        Takes parallel lists of ids and returns a list of dbids (None if not in library) in the same order
+        """
+        if not self.database:
+            return [None] * len(tmdb_ids)
+
+        imdb_lookup, tmdb_lookup, tvdb_lookup = self.uid_dbid_lookup
+
+        def _get_dbid(tmdb_id, tvdb_id, imdb_id):
+            if imdb_id and imdb_id in imdb_lookup:
+                return imdb_lookup[imdb_id]
+            if tmdb_id and str(tmdb_id) in tmdb_lookup:
+                return tmdb_lookup[str(tmdb_id)]
+            if tvdb_id and str(tvdb_id) in tvdb_lookup:
+                return tvdb_lookup[str(tvdb_id)]
+
+        return [_get_dbid(*ids) for ids in zip(tmdb_ids, tvdb_ids, imdb_ids)]
+
     def get_info(
         self, info, dbid=None, imdb_id=None, originaltitle=None, title=None, year=None,
         season=None, episode=None, fuzzy_match=False, tmdb_id=None, tvdb_id=None
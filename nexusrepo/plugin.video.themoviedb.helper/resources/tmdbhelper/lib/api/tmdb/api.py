@@ -1,8 +1,10 @@
+import sys
 from tmdbhelper.lib.addon.plugin import get_language, get_setting
 from tmdbhelper.lib.api.request import NoCacheRequestAPI
 from tmdbhelper.lib.api.tmdb.mapping import ItemMapper
 from tmdbhelper.lib.api.api_keys.tmdb import API_KEY
 from jurialmunkey.ftools import cached_property
+from jurialmunkey.parser import try_int
 
 # Constants for better performance
 API_URLS = {
@@ -17,24 +19,17 @@ URL_SEPARATORS = {
     'DEFAULT': '%2C'
 }
 
-# Cache API URL determination to avoid repeated setting lookups
-_cached_api_url = None
-_api_url_checked = False
 
-def get_api_url():
-    """Cached API URL determination"""
-    global _cached_api_url, _api_url_checked
-    if not _api_url_checked:
-        _cached_api_url = API_URLS['ALTERNATE'] if get_setting('use_alternate_api_url') else API_URLS['STANDARD']
-        _api_url_checked = True
-    return _cached_api_url
+def _compute_api_url():
+    """API URL determination - evaluated once at class creation"""
+    return API_URLS['ALTERNATE'] if get_setting('use_alternate_api_url') else API_URLS['STANDARD']
 
 
 class TMDbAPI(NoCacheRequestAPI):
     """Optimized TMDb API with improved caching and performance"""
 
     api_key = API_KEY
-    api_url = get_api_url()
+    api_url = _compute_api_url()
     append_to_response = ''
     append_to_response_person = ''
     api_name = 'TMDbAPI'
@@ -52,96 +47,81 @@ class TMDbAPI(NoCacheRequestAPI):
         
         self.language = language
         TMDb.api_key = api_key
-        
-        # Cache frequently computed values
-        self._cached_iso_language = None
-        self._cached_iso_country = None
-        self._cached_req_language = None
-        self._cached_mapper = None
 
     @property
     def req_strip(self):
-        """Optimized request strip with cached computation"""
-        if not hasattr(self, '_cached_req_strip_add'):
-            self._cached_req_strip_add = [
-                (self.append_to_response, 'standard'),
-                (self.append_to_response_person, 'person'),
-                (self.append_to_response_tvshow, 'tvshow'),
-                (self.append_to_response_tvshow_simple, 'tvshow_simple'),
-                (self.append_to_response_movies_simple, 'movies_simple'),
-                (self.req_language, f'{self.iso_language}_en')
-            ]
-        
+        """Cached request strip list - rebuilt only when base strip or language changes"""
+        try:
+            return self._req_strip_full
+        except AttributeError:
+            pass
         try:
-            return self._req_strip + self._cached_req_strip_add
+            req_strip = self._req_strip
         except AttributeError:
-            self._req_strip = [
+            req_strip = self._req_strip = [
                 (self.req_api_url, self.req_api_name),
                 (self.req_api_key, ''),
                 ('is_xml=False', ''),
                 ('is_xml=True', '')
             ]
-            return self._req_strip + self._cached_req_strip_add
+        self._req_strip_full = req_strip + [
+            (self.append_to_response, 'standard'),
+            (self.append_to_response_person, 'person'),
+            (self.append_to_response_tvshow, 'tvshow'),
+            (self.append_to_response_tvshow_simple, 'tvshow_simple'),
+            (self.append_to_response_movies_simple, 'movies_simple'),
+            (self.req_language, f'{self.iso_language}_en')
+        ]
+        return self._req_strip_full
 
     @req_strip.setter
     def req_strip(self, value):
         self._req_strip = value
-        # Invalidate cached req_strip_add when base changes
-        if hasattr(self, '_cached_req_strip_add'):
-            delattr(self, '_cached_req_strip_add')
+        # Invalidate cached full strip list when base changes
+        self.__dict__.pop('_req_strip_full', None)
 
-    @property
+    @cached_property
     def req_language(self):
         """Cached request language to avoid repeated string operations"""
-        if self._cached_req_language is None:
-            self._cached_req_language = f'{self.iso_language}-{self.iso_country}'
-        return self._cached_req_language
+        return f'{self.iso_language}-{self.iso_country}'
 
-    @property
+    @cached_property
     def iso_language(self):
         """Cached ISO language code"""
-        if self._cached_iso_language is None:
-            self._cached_iso_language = self.language[:2]
-        return self._cached_iso_language
+        return self.language[:2]
 
-    @property
+    @cached_property
     def iso_country(self):
         """Cached ISO country code"""
-        if self._cached_iso_country is None:
-            self._cached_iso_country = self.language[-2:]
-        return self._cached_iso_country
+        return self.language[-2:]
 
     @property
     def genres(self):
         """Base class returns None - overridden in TMDb class"""
         return None
 
-    @property
+    @cached_property
     def mapper(self):
         """Cached mapper instance to avoid repeated creation"""
-        if self._cached_mapper is None:
-            self._cached_mapper = ItemMapper(self.language, self.genres)
-        return self._cached_mapper
+        return ItemMapper(self.language, self.genres)
 
     @staticmethod
     def get_url_separator(separator=None):
-        """Optimized URL separator using dict lookup"""
-        if separator in URL_SEPARATORS:
-            return URL_SEPARATORS[separator]
-        elif not separator:
+        """Optimized URL separator using a single dict lookup"""
+        if not separator:
             return URL_SEPARATORS['DEFAULT']
-        else:
-            return False
+        return URL_SEPARATORS.get(separator, False)
 
     @staticmethod
     def get_paginated_items(items, limit=None, page=1, total_pages=None):
         """Optimized pagination with early returns and reduced imports"""
-        from jurialmunkey.parser import try_int
-        
         # Handle total_pages pagination first (most common case)
-        if total_pages and try_int(page) < try_int(total_pages):
-            items.append({'next_page': try_int(page) + 1})
-            return items
+        if total_pages:
+            int_page = page if isinstance(page, int) else try_int(page)
+            int_total_pages = total_pages if isinstance(total_pages, int) else try_int(total_pages)
+            if int_page < int_total_pages:
+                items.append({'next_page': int_page + 1})
+                return items
         
         # Handle limit-based pagination
         if limit is not None:
@@ -164,12 +144,8 @@ class TMDbAPI(NoCacheRequestAPI):
 
     def invalidate_cache(self):
         """Clear cached values when language changes"""
-        self._cached_iso_language = None
-        self._cached_iso_country = None
-        self._cached_req_language = None
-        self._cached_mapper = None
-        if hasattr(self, '_cached_req_strip_add'):
-            delattr(self, '_cached_req_strip_add')
+        for k in ('iso_language', 'iso_country', 'req_language', 'mapper', '_req_strip_full'):
+            self.__dict__.pop(k, None)
 
 
 class TMDb(TMDbAPI):
@@ -183,24 +159,16 @@ class TMDb(TMDbAPI):
     append_to_response_tvshow_simple = 'images,external_ids,content_ratings'
     api_name = 'TMDb'
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Cache setting values to avoid repeated lookups
-        self._setting_ignore_regionreleasefilter = None
-        self._setting_checked = False
-        
-        # Cache computed language strings
-        self._cached_include_image_language = None
-        self._cached_include_video_language = None
-
     @property
     def tmdb_database(self):
         """Lazy-loaded database with proper circular import handling"""
-        if not hasattr(self, '_tmdb_database'):
-            from tmdbhelper.lib.query.database.database import FindQueriesDatabase
-            self._tmdb_database = FindQueriesDatabase()
-            self._tmdb_database.tmdb_api = self  # Must override attribute to avoid circular import
+        try:
+            return self.__dict__['_tmdb_database']
+        except KeyError:
+            pass
+        from tmdbhelper.lib.query.database.database import FindQueriesDatabase
+        self._tmdb_database = FindQueriesDatabase()
+        self._tmdb_database.tmdb_api = self  # Must override attribute to avoid circular import
         return self._tmdb_database
 
     @property
@@ -220,43 +188,40 @@ class TMDb(TMDbAPI):
             return self.iso_country
         return None
 
-    @property
+    @cached_property
     def setting_ignore_regionreleasefilter(self):
         """Cached setting lookup to avoid repeated API calls"""
-        if not self._setting_checked:
-            self._setting_ignore_regionreleasefilter = get_setting('ignore_regionreleasefilter')
-            self._setting_checked = True
-        return self._setting_ignore_regionreleasefilter
+        return get_setting('ignore_regionreleasefilter')
 
-    @property
+    @cached_property
+    def iso_language_null_en(self):
+        """Shared language fallback string for image and video requests"""
+        return sys.intern(f'{self.iso_language},null,en')
+
+    @cached_property
     def include_image_language(self):
         """Cached image language string"""
-        if self._cached_include_image_language is None:
-            self._cached_include_image_language = f'{self.iso_language},null,en'
-        return self._cached_include_image_language
+        return self.iso_language_null_en
 
-    @property
+    @cached_property
     def include_video_language(self):
         """Cached video language string"""
-        if self._cached_include_video_language is None:
-            self._cached_include_video_language = f'{self.iso_language},null,en'
-        return self._cached_include_video_language
+        return self.iso_language_null_en
 
-    def configure_request_kwargs(self, kwargs):
-        """Enhanced request configuration with all TMDb-specific parameters"""
-        # Start with base configuration
-        kwargs = super().configure_request_kwargs(kwargs)
-        
-        # Add TMDb-specific parameters efficiently
+    @cached_property
+    def base_request_kwargs(self):
+        """Cached TMDb-specific request parameters merged into every request"""
+        kwargs = {'language': self.req_language}
         region = self.iso_region
         if region:
             kwargs['region'] = region
-            
-        kwargs.update({
-            'include_image_language': self.include_image_language,
-            'include_video_language': self.include_video_language
-        })
-        
+        kwargs['include_image_language'] = self.include_image_language
+        kwargs['include_video_language'] = self.include_video_language
+        return kwargs
+
+    def configure_request_kwargs(self, kwargs):
+        """Enhanced request configuration with all TMDb-specific parameters in a single merge"""
+        kwargs.update(self.base_request_kwargs)
         return kwargs
 
     def invalidate_cache(self):
@@ -264,19 +229,10 @@ class TMDb(TMDbAPI):
         super().invalidate_cache()
         
         # Clear TMDb-specific caches
-        self._setting_checked = False
-        self._setting_ignore_regionreleasefilter = None
-        self._cached_include_image_language = None
-        self._cached_include_video_language = None
+        for k in (
+                'iso_language_null_en', 'include_image_language', 'include_video_language',
+                'setting_ignore_regionreleasefilter', 'base_request_kwargs'):
+            self.__dict__.pop(k, None)
         
         # Clear database cache if it exists
-        if hasattr(self, '_tmdb_database'):
-            delattr(self, '_tmdb_database')
-
-    def reset_settings_cache(self):
-        """Force settings cache refresh (useful for settings changes)"""
-        self._setting_checked = False
-        self._setting_ignore_regionreleasefilter = None
-        # Also invalidate global API URL cache
-        global _api_url_checked
-        _api_url_checked = False
\ No newline at end of file
+        self.__dict__.pop('_tmdb_database', None)
@@ -3,10 +3,80 @@
 from tmdbhelper.lib.addon.logger import kodi_log, TimerFunc
 from tmdbhelper.lib.addon.plugin import get_setting, get_version
 from tmdbhelper.lib.files.futils import FileUtils
+from threading import Lock, local
+from functools import lru_cache, wraps
+from contextlib import contextmanager
+from weakref import WeakSet, finalize
+import atexit
 import sqlite3
 
 DEFAULT_TABLE = 'simplecache'
 DATABASE_NAME = 'database_07'
+STATEMENT_CACHE_MAXSIZE = 256
+
+
+def cached_statement(func):
+    """Memoize a pure SQL statement builder - list arguments are retried as tuples"""
+    cached_func = lru_cache(maxsize=STATEMENT_CACHE_MAXSIZE)(func)
+
+    def hashable(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached_func(*args, **kwargs)
+        except TypeError:
+            args = tuple(hashable(i) for i in args)
+            kwargs = {k: hashable(v) for k, v in kwargs.items()}
+            return cached_func(*args, **kwargs)
+
+    wrapper.cache_info = cached_func.cache_info
+    wrapper.cache_clear = cached_func.cache_clear
+    return wrapper
+
+
+@lru_cache(maxsize=STATEMENT_CACHE_MAXSIZE)
+def _create_table_statements(table, column_items):
+    data, fkey, uids, indexes = [], [], [], []
+    for k, v in column_items:
+        v = dict(v)
+        data.append(f'{k} {v["data"]}')
+        if 'foreign_key' in v:
+            fkey.append(f'FOREIGN KEY({k}) REFERENCES {v["foreign_key"]} ON DELETE CASCADE')
+        if v.get('unique'):
+            uids.append(k)
+        if v.get('indexed'):
+            indexes.append(f'CREATE INDEX IF NOT EXISTS {table}_{k}_x ON {table}({k})')
+    parts = data + fkey + ([f'UNIQUE ({", ".join(uids)})'] if uids else [])
+    return f'CREATE TABLE IF NOT EXISTS {table}({", ".join(parts)})', tuple(indexes)
+
+
+def create_table_statements(table, columns):
+    """Build CREATE TABLE and CREATE INDEX statements in a single pass over the column definitions"""
+    return _create_table_statements(table, tuple((k, tuple(v.items())) for k, v in columns.items()))
+
+
+def close_connections(connections):
+    for connection in list(connections.values()):
+        try:
+            connection.close()
+        except Exception:
+            pass
+    connections.clear()
+
+
+class ThreadConnections:
+    """
+    Connections owned by one thread - kept only in that thread's local storage
+    The finalizer closes them once the thread ends and its local storage is released
+    """
+
+    __slots__ = ('connections', '__weakref__')
+
+    def __init__(self):
+        self.connections = {}
+        finalize(self, close_connections, self.connections)
 
 
 class DatabaseCore:
@@ -14,11 +84,21 @@ class DatabaseCore:
     _fileutils = FileUtils()
     _db_timeout = 60.0
     _db_read_timeout = 1.0
+    _db_cached_statements = 256
     database_version = 1
     database_changes = {}
+    _window_home = None
+    _window_lock = Lock()
+    _instances = WeakSet()
+    _wal_initialized = set()  # journal_mode is persisted in the database file so only needs setting once per file
 
     def __init__(self, folder=None, filename=None):
         '''Initialize our caching class'''
+        self._thread_local = local()
+        self._thread_connections = WeakSet()  # Live ThreadConnections so open connections can be closed at exit
+        self._thread_connections_lock = Lock()
+        DatabaseCore._instances.add(self)
+
         folder = folder or DATABASE_NAME
         basefolder = f'{self._basefolder}{folder}'
         filename = filename or 'defaultcache.db'
@@ -30,8 +110,14 @@ class DatabaseCore:
 
     @property
     def window_home(self):
-        from xbmcgui import Window
-        return Window(10000)
+        window = DatabaseCore._window_home
+        if window is None:
+            with DatabaseCore._window_lock:
+                window = DatabaseCore._window_home
+                if window is None:
+                    from xbmcgui import Window
+                    window = DatabaseCore._window_home = Window(10000)
+        return window
 
     def get_window_property(self, name):
         return self.window_home.getProperty(name)
@@ -65,10 +151,18 @@ class DatabaseCore:
             self.init_database()
 
     def set_pragmas(self, connection):
-        cursor = connection.cursor()
-        cursor.execute("PRAGMA synchronous=NORMAL")
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.execute("PRAGMA foreign_keys=ON")
+        if self._db_file in DatabaseCore._wal_initialized:
+            connection.executescript(
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA foreign_keys=ON;"
+            )
+            return connection
+        connection.executescript(
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA foreign_keys=ON;"
+        )
+        DatabaseCore._wal_initialized.add(self._db_file)
         return connection
 
     def init_database(self):
@@ -89,16 +183,60 @@ class DatabaseCore:
         except Exception as error:
             self.kodi_log(f'CACHE: Exception while initializing _database: {error}\n{self._sc_name}', 1)
 
-    def get_database(self, read_only=False, log_level=1):
+    def get_database(self, read_only=False, log_level=1, check_same_thread=True):
         timeout = self._db_read_timeout if read_only else self._db_timeout
         try:
-            connection = sqlite3.connect(self._db_file, timeout=timeout)
+            connection = sqlite3.connect(
+                self._db_file, timeout=timeout,
+                check_same_thread=check_same_thread,
+                cached_statements=self._db_cached_statements)
         except Exception as error:
             self.kodi_log(f'CACHE: ERROR while retrieving _database: {error}\n{self._sc_name}', log_level)
             return None
         connection.row_factory = sqlite3.Row
         return self.set_pragmas(connection)
 
+    def get_thread_database(self, read_only=False):
+        """
+        Persistent connection owned by the calling thread - opened and configured once then reused
+        Only the owning thread uses it so check_same_thread is relaxed purely to allow closing at exit
+        """
+        thread_connections = getattr(self._thread_local, 'connections', None)
+        if thread_connections is None:
+            thread_connections = self._thread_local.connections = ThreadConnections()
+            with self._thread_connections_lock:
+                self._thread_connections.add(thread_connections)
+        name = 'read_connection' if read_only else 'write_connection'
+        connection = thread_connections.connections.get(name)
+        if connection is not None:
+            return connection
+        connection = self.get_database(read_only=read_only, check_same_thread=False)
+        if connection is None:
+            return None
+        thread_connections.connections[name] = connection
+        return connection
+
+    @contextmanager
+    def batch(self):
+        """
+        One write transaction spanning several statements on this thread's connection
+        Commits on exit and rolls back on error - nested batches join the outer transaction
+        """
+        connection = self.get_thread_database()
+        if connection.in_transaction:
+            yield connection
+            return
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            yield connection
+
+    def close_thread_databases(self):
+        with self._thread_connections_lock:
+            thread_connections = list(self._thread_connections)
+        for i in thread_connections:
+            close_connections(i.connections)
+        self._thread_local = local()
+
     def database_execute(self, connection, query, data=None):
         try:
             if not data:
@@ -115,7 +253,7 @@ class DatabaseCore:
         try:
             if connection:
                 return self.database_execute(connection, query, data=data)
-            with self.get_database(read_only=read_only) as conn:
+            with self.get_thread_database(read_only=read_only) as conn:
                 return self.database_execute(conn, query, data=data)
         except Exception as database_exception:
             self.kodi_log(f'CACHE: database GET DATABASE ERROR! -- {database_exception}\n{self._sc_name} -- read_only: {read_only}', 2)
@@ -125,16 +263,6 @@ class DatabaseCore:
         return {}
 
     def create_database_execute(self, connection):
-        def create_column_data(columns):
-            return [f'{k} {v["data"]}' for k, v in columns.items()]
-        
-        def create_column_fkey(columns):
-            return [f'FOREIGN KEY({k}) REFERENCES {v["foreign_key"]} ON DELETE CASCADE' for k, v in columns.items() if 'foreign_key' in v]
-
-        def create_column_uids(columns):
-            keys = [k for k, v in columns.items() if v.get('unique')]
-            return [f'UNIQUE ({", ".join(keys)})'] if keys else []
-
         cursor = connection.cursor()
         this_database_version = cursor.execute("PRAGMA user_version").fetchone()[0]
 
@@ -145,18 +273,16 @@ class DatabaseCore:
                     try: cursor.execute(query)
                     except Exception as error: self.kodi_log(f'CACHE: Exception while initializing _database: {error}\n{self._sc_name} - {query}', 1)
 
+        index_queries = []
         for table, columns in self.database_tables.items():
-            query_parts = create_column_data(columns) + create_column_fkey(columns) + create_column_uids(columns)
-            query = f'CREATE TABLE IF NOT EXISTS {table}({", ".join(query_parts)})'
+            query, indexes = create_table_statements(table, columns)
+            index_queries.extend(indexes)
             try: cursor.execute(query)
             except Exception as error: self.kodi_log(f'CACHE: Exception while initializing _database: {error}\n{self._sc_name} - {query}', 1)
 
-        for table, columns in self.database_tables.items():
-            for column, v in columns.items():
-                if not v.get('indexed'): continue
-                query = f'CREATE INDEX IF NOT EXISTS {table}_{column}_x ON {table}({column})'
-                try: cursor.execute(query)
-                except Exception as error: self.kodi_log(f'CACHE: Exception while initializing _database: {error}\n{self._sc_name} - {query}', 1)
+        for query in index_queries:
+            try: cursor.execute(query)
+            except Exception as error: self.kodi_log(f'CACHE: Exception while initializing _database: {error}\n{self._sc_name} - {query}', 1)
 
         if this_database_version < self.database_version:
             try:
@@ -169,38 +295,46 @@ class DatabaseCore:
 
 class DatabaseStatements:
     @staticmethod
+    @cached_statement
     def insert_or_ignore(table, keys=('id',)):
         return f"INSERT OR IGNORE INTO {table}({', '.join(keys)}) VALUES ({', '.join(['?' for _ in keys])})"
 
     @staticmethod
+    @cached_statement
     def insert_or_replace(table, keys=('id',)):
         return f"INSERT OR REPLACE INTO {table}({', '.join(keys)}) VALUES ({', '.join(['?' for _ in keys])})"
 
     @staticmethod
+    @cached_statement
     def insert_or_update_if_null(table, keys=('id',), conflict_constraint='id'):
         update_keys = ', '.join([f'{k}=ifnull({k},excluded.{k})' for k in keys])
         return f"INSERT INTO {table}({', '.join(keys)}) VALUES ({', '.join(['?' for _ in keys])}) ON CONFLICT ({conflict_constraint}) DO UPDATE SET {update_keys}"
 
     @staticmethod
+    @cached_statement
     def delete_keys(table, keys, conditions='item_type=?'):
         update_keys = ', '.join([f'{k}=NULL' for k in keys])
         conditions_str = f'WHERE {conditions}' if conditions else ''
         return f'UPDATE {table} SET {update_keys} {conditions_str}'
 
     @staticmethod
+    @cached_statement
     def delete_item(table, conditions='id=?'):
         return f'DELETE FROM {table} WHERE {conditions}'
 
     @staticmethod
+    @cached_statement
     def update_if_null(table, keys, conditions='id=?'):
         update_keys = ', '.join([f'{k}=ifnull(?,{k})' for k in keys])
         return f'UPDATE {table} SET {update_keys} WHERE {conditions}'
 
     @staticmethod
+    @cached_statement
     def select_limit(table, keys, conditions='id=?'):
         return f"SELECT {', '.join(keys)} FROM {table} WHERE {conditions} LIMIT 1"
 
     @staticmethod
+    @cached_statement
     def select(table, keys, conditions=None):
         conditions_str = f' WHERE {conditions}' if conditions else ''
         return f"SELECT {', '.join(keys)} FROM {table}{conditions_str}"
@@ -235,7 +369,7 @@ class DatabaseMethod:
         
         if connection: _transaction(connection)
         else:
-            with self.get_database() as conn: _transaction(conn)
+            with self.batch() as conn: _transaction(conn)
 
     def set_many_values(self, table=DEFAULT_TABLE, keys=(), data=None, connection=None):
         if not data: return
@@ -245,7 +379,7 @@ class DatabaseMethod:
 
         if connection: _transaction(connection)
         else:
-            with self.get_database() as conn: _transaction(conn)
+            with self.batch() as conn: _transaction(conn)
 
     def del_column_values(self, table=DEFAULT_TABLE, keys=(), item_type=None, connection=None):
         conditions = 'item_type=?' if item_type is not None else None
@@ -267,4 +401,10 @@ class DatabaseMethod:
 
 
 class Database(DatabaseCore, DatabaseMethod):
-    pass
\ No newline at end of file
+    pass
+
+
+@atexit.register
+def close_thread_databases():
+    for database in list(DatabaseCore._instances):
+        database.close_thread_databases()
\ No newline at end of file
@@ -1,10 +1,12 @@
 from jurialmunkey.parser import boolean, try_int
 from tmdbhelper.lib.addon.plugin import get_localized
 from jurialmunkey.ftools import cached_property
-from tmdbhelper.lib.addon.tmdate import get_datetime_today, get_timedelta, get_calendar_name, datetime_in_range
+from tmdbhelper.lib.addon.tmdate import get_datetime_today, get_timedelta, get_calendar_name
 from tmdbhelper.lib.items.directories.trakt.lists_standard import ListTraktStandardProperties
 from tmdbhelper.lib.items.directories.trakt.lists_filtered import ListTraktFiltered
 from tmdbhelper.lib.items.directories.trakt.mapper_calendar import (
+    CalendarEpisodeItemMapper,
+    CalendarMovieItemMapper,
     FactoryCalendarEpisodeItemMapper,
     FactoryCalendarMovieItemMapper,
 )
@@ -13,6 +15,51 @@ from tmdbhelper.lib.items.directories.mdblist.lists_local import (
     UncachedMDbListLocalData,
 )
 from tmdbhelper.lib.items.directories.lists_default import ItemCache
+from functools import lru_cache
+from collections import OrderedDict
+from threading import Lock
+import time
+
+
+CALENDAR_URL_SHOWS = 'calendars/{trakt_user}/shows/{trakt_path}{start_date}/{total_days}'
+CALENDAR_URL_MOVIES = 'calendars/{trakt_user}/movies/{start_date}/{total_days}'
+CALENDAR_URL_DVDS = 'calendars/{trakt_user}/dvd/{start_date}/{total_days}'
+
+# Compiled formatters for the known calendar templates - other templates fall back to str.format
+CALENDAR_URL_FORMATTERS = {
+    CALENDAR_URL_SHOWS: lambda trakt_user, trakt_path, start_date, total_days: f'calendars/{trakt_user}/shows/{trakt_path}{start_date}/{total_days}',
+    CALENDAR_URL_MOVIES: lambda trakt_user, trakt_path, start_date, total_days: f'calendars/{trakt_user}/movies/{start_date}/{total_days}',
+    CALENDAR_URL_DVDS: lambda trakt_user, trakt_path, start_date, total_days: f'calendars/{trakt_user}/dvd/{start_date}/{total_days}',
+}
+
+
+def fast_int(value):
+    """try_int that skips the conversion when internal callers already pass an int"""
+    return value if type(value) is int else try_int(value)
+
+
+def fast_bool(value):
+    """boolean that skips the string check when internal callers already pass a bool"""
+    return value if type(value) is bool else boolean(value)
+
+
+def get_calendar_start_date(days):
+    """Start date string offset from today"""
+    start_date = get_datetime_today() + get_timedelta(days=days)
+    return start_date.strftime('%Y-%m-%d')
+
+
+@lru_cache(maxsize=256)
+def _get_response_cache_name(url, trakt_filters_items):
+    return '_'.join(('TraktData', url, *sorted(f'{k}={v}' for k, v in trakt_filters_items)))
+
+
+def get_response_cache_name(url, trakt_filters):
+    """Cache name for a calendar response - shared by every page using the same url and filters"""
+    try:
+        return _get_response_cache_name(url, frozenset(trakt_filters.items()))
+    except TypeError:  # Unhashable filter value
+        return '_'.join(('TraktData', url, *sorted(f'{k}={v}' for k, v in trakt_filters.items())))
 
 
 class ListTraktMyAiring(ListTraktFiltered):
@@ -30,29 +77,80 @@ class ListTraktMyAiring(ListTraktFiltered):
         return list_properties
 
 
+class UncachedCalendarItemsPage(UncachedMDbListItemsPage):
+    def get_items(self):
+        """
+        Map and drop out-of-range air dates in a single pass
+        Rank still counts every result so it matches the position in the calendar response
+        """
+        results = self.results  # Populates total_pages and total_items on outer_class
+        get_mapped_item = self.outer_class.get_mapped_item
+        totals = (
+            ('total_pages', self.outer_class.total_pages),
+            ('total_results', self.outer_class.total_items),
+        )
+        items = []
+        for x, i in enumerate(results, 1):
+            if not i:
+                continue
+            j = get_mapped_item(i, add_infoproperties=(*totals, ('rank', x)))
+            if j:
+                items.append(j)
+        return items
+
+
 class CachedResponse:
-    def __init__(self, trakt_api, url, trakt_filters):
+    __slots__ = ('trakt_filters', 'trakt_api', 'url', '__dict__')  # __dict__ kept for cache_name and json cached_property storage
+
+    def __init__(self, trakt_api, url, trakt_filters, cache_days=None):
         self.trakt_filters = trakt_filters
         self.trakt_api = trakt_api
         self.url = url
+        if cache_days is not None:
+            self.cache_days = cache_days
 
     cache_days = 0.25
 
+    # In-process LRU in front of the ItemContainer.db cache so repeat page loads skip the disk read and json parse
+    # Responses are shared between callers so must be treated as read-only
+    memory_cache = OrderedDict()
+    memory_cache_lock = Lock()
+    memory_cache_maxsize = 128
+
     @cached_property
     def cache_name(self):
-        cache_name_list = [f'{k}={v}' for k, v in self.trakt_filters.items()]
-        cache_name_list = sorted(cache_name_list)
-        cache_name_list = ['TraktData', self.url] + cache_name_list
-        return '_'.join(cache_name_list)
+        return get_response_cache_name(self.url, self.trakt_filters)
 
     @ItemCache('ItemContainer.db')
     def get_cached_response(self):
         data = self.trakt_api.get_response(self.url, **self.trakt_filters)
         return data.json() if data else None
 
+    def get_memory_cached_response(self):
+        cache_name = self.cache_name
+        with self.memory_cache_lock:
+            try:
+                expiry, data = self.memory_cache[cache_name]
+            except KeyError:
+                expiry, data = 0, None
+            if expiry > time.monotonic():
+                self.memory_cache.move_to_end(cache_name)
+                return data
+
+        data = self.get_cached_response()
+        if data is None:
+            return
+
+        with self.memory_cache_lock:
+            self.memory_cache[cache_name] = (time.monotonic() + self.cache_days * 86400, data)
+            self.memory_cache.move_to_end(cache_name)
+            while len(self.memory_cache) > self.memory_cache_maxsize:
+                self.memory_cache.popitem(last=False)
+        return data
+
     @cached_property
     def json(self):
-        return self.get_cached_response()
+        return self.get_memory_cached_response()
 
 
 class ListTraktCalendarProperties(ListTraktStandardProperties):
@@ -60,11 +158,14 @@ class ListTraktCalendarProperties(ListTraktStandardProperties):
     For episode type calendars
     """
 
-    class_pages = UncachedMDbListItemsPage
+    class_pages = UncachedCalendarItemsPage
     trakt_path = ''
+    trakt_path_label = ''
     trakt_user = 'my'
     trakt_authorization = True
-    request_url = 'calendars/{trakt_user}/shows/{trakt_path}{start_date}/{total_days}'
+    request_url = CALENDAR_URL_SHOWS
+    container_content = 'episodes'
+    trakt_type = 'episode'
 
     def get_cache_name_list_prefix(self):
         return [
@@ -77,30 +178,43 @@ class ListTraktCalendarProperties(ListTraktStandardProperties):
 
     @cached_property
     def url(self):
-        return self.request_url.format(
-            trakt_user=self.trakt_user,
-            start_date=self.start_date,
-            total_days=self.total_days,
-            trakt_path=self.trakt_path,
-        )
+        try:
+            formatter = CALENDAR_URL_FORMATTERS[self.request_url]
+        except KeyError:
+            return self.request_url.format(
+                trakt_user=self.trakt_user,
+                start_date=self.start_date,
+                total_days=self.total_days,
+                trakt_path=self.trakt_path,
+            )
+        return formatter(self.trakt_user, self.trakt_path, self.start_date, self.total_days)
 
     @cached_property
     def start_date(self):
-        start_date = self.trakt_date - 1
-        start_date = get_datetime_today() + get_timedelta(days=start_date)
-        start_date = start_date.strftime('%Y-%m-%d')
-        return start_date
+        return get_calendar_start_date(self.trakt_date - 1)
 
     @cached_property
     def total_days(self):
         total_days = self.trakt_days + 2
         return total_days
 
+    @cached_property
+    def response_cache_days(self):
+        """
+        Cache lifetime based on where the requested window sits relative to today
+        Windows containing today keep the default as airings are still being updated
+        """
+        start_day = self.trakt_date - 1  # Request window is padded a day either side
+        if start_day + self.total_days <= 0:
+            return 7  # Entirely in the past so listings are settled
+        if start_day > 0:
+            return 1  # Entirely in the future so schedules change slowly
+        return CachedResponse.cache_days
+
     @cached_property
     def plugin_category(self):
         plugin_category = get_calendar_name(startdate=self.trakt_date, days=self.trakt_days)
-        plugin_category = f'{plugin_category} ({self.trakt_path[:-1].capitalize()})' if self.trakt_path else plugin_category
-        return plugin_category
+        return f'{plugin_category} ({self.trakt_path_label})' if self.trakt_path_label else plugin_category
 
     @cached_property
     def sorted_items(self):
@@ -116,29 +230,52 @@ class ListTraktCalendarProperties(ListTraktStandardProperties):
     def get_api_response_json(self):
         if self.trakt_authorization and not self.trakt_api.is_authorized:
             return
-        return CachedResponse(self.trakt_api, self.url, self.trakt_filters).json
+        return CachedResponse(self.trakt_api, self.url, self.trakt_filters, cache_days=self.response_cache_days).json
 
     def get_api_response(self, page=1):
         if not self.api_response_json:
             return
         return UncachedMDbListLocalData(self.api_response_json, self.page, self.limit).data
 
-    def get_mapped_item_air_date_check(self, item_mapper):
-        if not item_mapper.air_date:
-            return
-        if not datetime_in_range(item_mapper.air_date, days=self.trakt_days, start_date=self.trakt_date):
-            return
-        return item_mapper.item
+    @cached_property
+    def air_date_range(self):
+        """Bounds used by datetime_in_range computed once per list rather than once per item"""
+        date_a = get_datetime_today().date() + get_timedelta(days=self.trakt_date)
+        date_z = date_a + get_timedelta(days=self.trakt_days)
+        return (date_a, date_z)
+
+    def is_air_date_in_range(self, air_date):
+        if not air_date:
+            return False
+        date_a, date_z = self.air_date_range
+        return date_a <= air_date.date() < date_z
 
     def get_mapped_item(self, item, add_infoproperties=None):
-        item_mapper = FactoryCalendarEpisodeItemMapper(item, add_infoproperties)
-        return self.get_mapped_item_air_date_check(item_mapper)
+        # Check air date on the raw item first so out of range items never build a mapper
+        air_date = CalendarEpisodeItemMapper.peek_air_date(item, 'episode')
+        if not self.is_air_date_in_range(air_date):
+            return
+        item_mapper = FactoryCalendarEpisodeItemMapper(dict(item), add_infoproperties)  # Mapper merges sub_type into meta so copy shared response item
+        item_mapper.air_date = air_date
+        return item_mapper.item
 
 
 class ListTraktCalendarMovieProperties(ListTraktCalendarProperties):
+    request_url = CALENDAR_URL_MOVIES
+    container_content = 'movies'
+    trakt_type = 'movie'
+
     def get_mapped_item(self, item, add_infoproperties=None):
-        item_mapper = FactoryCalendarMovieItemMapper(item, add_infoproperties)
-        return self.get_mapped_item_air_date_check(item_mapper)
+        air_date = CalendarMovieItemMapper.peek_air_date(item, 'movie')
+        if not self.is_air_date_in_range(air_date):
+            return
+        item_mapper = FactoryCalendarMovieItemMapper(dict(item), add_infoproperties)  # Mapper merges sub_type into meta so copy shared response item
+        item_mapper.air_date = air_date
+        return item_mapper.item
+
+
+class ListTraktCalendarDVDProperties(ListTraktCalendarMovieProperties):
+    request_url = CALENDAR_URL_DVDS
 
 
 class ListLocalCalendarProperties(ListTraktCalendarProperties):
@@ -148,30 +285,28 @@ class ListLocalCalendarProperties(ListTraktCalendarProperties):
         from tmdbhelper.lib.api.kodi.rpc import get_kodi_library
         return get_kodi_library('tv')
 
-    def is_kodi_dbid(self, i):
-        if not self.kodi_db:
-            return False
-
-        try:
-            uids = i['show']['ids']
-        except KeyError:
-            return False
-
-        if not self.kodi_db.get_info(
-            info='dbid',
-            tmdb_id=uids.get('tmdb'),
-            tvdb_id=uids.get('tvdb'),
-            imdb_id=uids.get('imdb')
-        ):
-            return False
-
-        return True
-
     @cached_property
     def api_response_json(self):
-        api_response_json = self.get_api_response_json() or []
-        api_response_json = [i for i in api_response_json if self.is_kodi_dbid(i)]
-        return api_response_json
+        api_response_json = self.get_api_response_json() or ()
+
+        kodi_db = self.kodi_db
+        if not kodi_db:
+            return []
+
+        # Split ids into parallel lists in one walk then look them all up against the library together
+        items, tmdb_ids, tvdb_ids, imdb_ids = [], [], [], []
+        for i in api_response_json:
+            show = i.get('show')
+            uids = show.get('ids') if show else None
+            if not uids:
+                continue
+            items.append(i)
+            tmdb_ids.append(uids.get('tmdb'))
+            tvdb_ids.append(uids.get('tvdb'))
+            imdb_ids.append(uids.get('imdb'))
+
+        dbids = kodi_db.get_info_bulk(tmdb_ids, tvdb_ids, imdb_ids)
+        return [i for i, dbid in zip(items, dbids) if dbid]
 
     def get_api_response(self, page=1):
         if not self.api_response_json:
@@ -182,19 +317,12 @@ class ListLocalCalendarProperties(ListTraktCalendarProperties):
 class ListTraktCalendar(ListTraktFiltered):
     list_properties_class = ListTraktCalendarProperties
 
-    def configure_list_properties(self, list_properties):
-        list_properties = super().configure_list_properties(list_properties)
-        list_properties.trakt_authorization = True
-        list_properties.request_url = 'calendars/{trakt_user}/shows/{trakt_path}{start_date}/{total_days}'
-        list_properties.container_content = 'episodes'
-        list_properties.trakt_type = 'episode'
-        return list_properties
-
     def get_items(self, *args, startdate, days, endpoint=None, user=True, tmdb_type='tv', **kwargs):
-        self.list_properties.trakt_user = 'my' if boolean(user) else 'all'
-        self.list_properties.trakt_date = try_int(startdate)
-        self.list_properties.trakt_days = try_int(days)
+        self.list_properties.trakt_user = 'my' if fast_bool(user) else 'all'
+        self.list_properties.trakt_date = fast_int(startdate)
+        self.list_properties.trakt_days = fast_int(days)
         self.list_properties.trakt_path = f'{endpoint}/' if endpoint else ''
+        self.list_properties.trakt_path_label = endpoint.capitalize() if endpoint else ''
         return super().get_items(*args, tmdb_type=tmdb_type, **kwargs)
 
 
@@ -202,26 +330,15 @@ class ListTraktMoviesCalendar(ListTraktFiltered):
 
     list_properties_class = ListTraktCalendarMovieProperties
 
-    def configure_list_properties(self, list_properties):
-        list_properties = super().configure_list_properties(list_properties)
-        list_properties.trakt_authorization = True
-        list_properties.request_url = 'calendars/{trakt_user}/movies/{start_date}/{total_days}'
-        list_properties.container_content = 'movies'
-        list_properties.trakt_type = 'movie'
-        return list_properties
-
     def get_items(self, *args, startdate, days, user=True, tmdb_type='movie', **kwargs):
-        self.list_properties.trakt_user = 'my' if boolean(user) else 'all'
-        self.list_properties.trakt_date = try_int(startdate)
-        self.list_properties.trakt_days = try_int(days)
+        self.list_properties.trakt_user = 'my' if fast_bool(user) else 'all'
+        self.list_properties.trakt_date = fast_int(startdate)
+        self.list_properties.trakt_days = fast_int(days)
         return super().get_items(*args, tmdb_type=tmdb_type, **kwargs)
 
 
 class ListTraktDVDsCalendar(ListTraktMoviesCalendar):
-    def configure_list_properties(self, list_properties):
-        list_properties = super().configure_list_properties(list_properties)
-        list_properties.request_url = 'calendars/{trakt_user}/dvd/{start_date}/{total_days}'
-        return list_properties
+    list_properties_class = ListTraktCalendarDVDProperties
 
 
 class ListLocalCalendar(ListTraktCalendar):
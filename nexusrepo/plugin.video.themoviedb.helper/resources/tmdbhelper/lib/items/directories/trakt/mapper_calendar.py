@@ -4,13 +4,26 @@ from jurialmunkey.ftools import cached_property
 
 
 class CalendarItemMapper:
-    @cached_property
-    def air_date(self):
+    air_date_key = 'first_aired'
+    air_date_kwargs = {'utc_convert': True}
+
+    @classmethod
+    def peek_air_date(cls, meta, sub_type=None):
+        """
+        Air date from a raw response item without constructing the mapper
+        Sub type values take precedence to match the merged meta built by __init__
+        """
         try:
-            return convert_timestamp(self.meta['first_aired'], utc_convert=True)
+            sub_meta = (meta.get(sub_type) or {}) if sub_type else {}
+            value = sub_meta[cls.air_date_key] if cls.air_date_key in sub_meta else meta[cls.air_date_key]
+            return convert_timestamp(value, **cls.air_date_kwargs)
         except (KeyError, TypeError, AttributeError):
             return
 
+    @cached_property
+    def air_date(self):
+        return self.peek_air_date(self.meta)
+
     def get_infoproperties(self):
         infoproperties = super().get_infoproperties()
         infoproperties.update({
@@ -36,13 +49,8 @@ class CalendarEpisodeItemMapper(CalendarItemMapper, EpisodeItemMapper):
 class CalendarMovieItemMapper(CalendarItemMapper, MovieItemMapper):
     tmdb_type = 'movie'
     mediatype = 'movie'
-
-    @cached_property
-    def air_date(self):
-        try:
-            return convert_timestamp(self.meta['released'], utc_convert=True, time_fmt="%Y-%m-%d", time_lim=10)
-        except (KeyError, TypeError, AttributeError):
-            return
+    air_date_key = 'released'
+    air_date_kwargs = {'utc_convert': True, 'time_fmt': "%Y-%m-%d", 'time_lim': 10}
 
 
 def FactoryCalendarMovieItemMapper(meta, add_infoproperties=None):
@@ -86,6 +86,11 @@ class ServiceMonitor(Poller):
             self.images_monitor.daemon = True  # Ensure clean shutdown
             self.images_monitor.start()
             self._monitor_threads['images'] = self.images_monitor
+
+            # Deferred storage optimization of manipulated images
+            if get_setting('images_autoopt'):
+                from tmdbhelper.lib.monitor.images import start_background_optimization
+                start_background_optimization()
             
         except Exception as e:
             self._log_error(f"Failed to start monitoring threads: {e}")
@@ -1,41 +1,60 @@
 import sys
 import xbmc
-from functools import cached_property
+
+
+class cached_property:
+    """
+    Lock-free cached_property that stores the value in a `_name` slot.
+    Context menu instances are short-lived and never shared across threads,
+    so the RLock taken by functools.cached_property is unnecessary overhead.
+    Owner classes must declare the backing slot in __slots__.
+    """
+
+    def __init__(self, func):
+        self.__doc__ = getattr(func, '__doc__')
+        self.func = func
+        self.slot = f'_{func.__name__}'
+
+    def __set_name__(self, owner, name):
+        self.slot = f'_{name}'
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = self.func(obj)
+            setattr(obj, self.slot, value)
+            return value
 
 
 class ContextMenu:
+    __slots__ = ('path_info', )
     path_base = 'plugin.video.themoviedb.helper'
-    path_kwgs = {}
+    path_kwgs_keys = ()
 
     def __init__(self, info):
         self.path_info = info
 
-    @cached_property
-    def path_args(self):
-        path_args = [
-            self.path_base,
-            self.path_info
-        ] + [
-            f'{k}={v}'
-            for k, v in self.path_kwgs.items()
-            if v not in (None, '')
-        ]
-        return tuple(path_args)
-
-    @cached_property
-    def path(self):
-        path = ','.join(self.path_args)
-        return f'RunScript({path})'
-
     def executebuiltin(self):
-        xbmc.executebuiltin(self.path)
+        parts = [self.path_base, self.path_info]
+        for k in self.path_kwgs_keys:
+            v = getattr(self, k)
+            if v is None or v == '':
+                continue
+            parts.append(f'{k}={v}')
+        xbmc.executebuiltin(f"RunScript({','.join(parts)})")
 
 
 class ContextMenuBasic(ContextMenu):
+    __slots__ = ('_tmdb_id', '_imdb_id', '_query', '_year', )
     tmdb_type = None
     season = None
     episode = None
     episode_year = None
+    path_kwgs_keys = (
+        'tmdb_type', 'tmdb_id', 'imdb_id', 'query', 'year', 'season', 'episode', 'episode_year')
 
     @cached_property
     def tmdb_id(self):
@@ -51,31 +70,21 @@ class ContextMenuBasic(ContextMenu):
 
     @cached_property
     def year(self):
-        return sys.listitem.getVideoInfoTag().getYear()
-
-    @cached_property
-    def path_kwgs(self):
-        return {
-            'tmdb_type': self.tmdb_type,
-            'tmdb_id': self.tmdb_id,
-            'imdb_id': self.imdb_id,
-            'query': self.query,
-            'year': self.year,
-            'season': self.season,
-            'episode': self.episode,
-            'episode_year': self.episode_year,
-        }
+        return sys.listitem.getVideoInfoTag().getYear() or None  # InfoTag returns 0 when unset
 
 
 class ContextMenuBasicMovie(ContextMenuBasic):
+    __slots__ = ()
     tmdb_type = 'movie'
 
 
 class ContextMenuBasicTvshow(ContextMenuBasic):
+    __slots__ = ()
     tmdb_type = 'tv'
 
 
 class ContextMenuBasicEpisode(ContextMenuBasic):
+    __slots__ = ('_season', '_episode', '_episode_year', )
     tmdb_type = 'tv'
     year = None
     imdb_id = None
@@ -98,63 +107,53 @@ class ContextMenuBasicEpisode(ContextMenuBasic):
 
     @cached_property
     def episode_year(self):
-        return sys.listitem.getVideoInfoTag().getYear()
+        return sys.listitem.getVideoInfoTag().getYear() or None  # InfoTag returns 0 when unset
 
 
 class ContextMenuPlayUsing:
-    @cached_property
-    def path_kwgs(self):
-        return {
-            'play': self.tmdb_type,
-            'tmdb_id': self.tmdb_id,
-            'imdb_id': self.imdb_id,
-            'query': self.query,
-            'year': self.year,
-            'season': self.season,
-            'episode': self.episode,
-            'episode_year': self.episode_year,
-            'ignore_default': 'true',
-        }
+    __slots__ = ()
+    ignore_default = 'true'
+    path_kwgs_keys = (
+        'play', 'tmdb_id', 'imdb_id', 'query', 'year', 'season', 'episode', 'episode_year', 'ignore_default')
+
+    @property
+    def play(self):
+        return self.tmdb_type
 
 
 class ContextMenuPlayUsingMovie(ContextMenuPlayUsing, ContextMenuBasicMovie):
-    pass
+    __slots__ = ()
 
 
 class ContextMenuPlayUsingEpisode(ContextMenuPlayUsing, ContextMenuBasicEpisode):
-    pass
+    __slots__ = ()
 
 
 ROUTES = {
-    'play_using': {
-        'base_class': 'ContextMenuPlayUsing',
-        'permission': ('movie', 'episode')
-    },
-    'sync_trakt': {
-        'base_class': 'ContextMenuBasic',
-        'permission': ('movie', 'tvshow', 'episode')
-    },
-    'related_lists': {
-        'base_class': 'ContextMenuBasic',
-        'permission': ('movie', 'tvshow', 'episode')
-    },
-    'refresh_details': {
-        'base_class': 'ContextMenuBasic',
-        'permission': ('movie', 'tvshow', 'episode')
-    },
+    ('play_using', 'movie'): ContextMenuPlayUsingMovie,
+    ('play_using', 'episode'): ContextMenuPlayUsingEpisode,
+    ('sync_trakt', 'movie'): ContextMenuBasicMovie,
+    ('sync_trakt', 'tvshow'): ContextMenuBasicTvshow,
+    ('sync_trakt', 'episode'): ContextMenuBasicEpisode,
+    ('related_lists', 'movie'): ContextMenuBasicMovie,
+    ('related_lists', 'tvshow'): ContextMenuBasicTvshow,
+    ('related_lists', 'episode'): ContextMenuBasicEpisode,
+    ('refresh_details', 'movie'): ContextMenuBasicMovie,
+    ('refresh_details', 'tvshow'): ContextMenuBasicTvshow,
+    ('refresh_details', 'episode'): ContextMenuBasicEpisode,
 }
 
+ROUTES_INFO = frozenset(info for info, mediatype in ROUTES)
+
 
 def run_context(info):
 
-    try:
-        mediatype = sys.listitem.getVideoInfoTag().getMediaType()
-        if mediatype not in ROUTES[info]['permission']:
-            raise ValueError(f'Route does not permit {mediatype} mediatype key')
-        class_object = getattr(sys.modules[__name__], f"{ROUTES[info]['base_class']}{mediatype.capitalize()}")
-    except KeyError:
-        class_object = ContextMenu
-    except ValueError:
+    if info not in ROUTES_INFO:
+        return ContextMenu(info).executebuiltin()
+
+    # Mediatypes missing from ROUTES are not permitted for that route
+    class_object = ROUTES.get((info, sys.listitem.getVideoInfoTag().getMediaType()))
+    if class_object is None:
         return
 
     instance = class_object(info)
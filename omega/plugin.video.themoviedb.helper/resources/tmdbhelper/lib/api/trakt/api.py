@@ -1,13 +1,29 @@
 from xbmcgui import Dialog, Window
-from jurialmunkey.ftools import cached_property
+from jurialmunkey.ftools import cached_property, threaded_cached_property
 from tmdbhelper.lib.addon.plugin import get_localized
 from tmdbhelper.lib.api.request import NoCacheRequestAPI
 from tmdbhelper.lib.api.api_keys.trakt import CLIENT_ID, CLIENT_SECRET, USER_TOKEN
 from tmdbhelper.lib.api.trakt.authenticator import TraktAuthenticator
 from tmdbhelper.lib.files.locker import mutexlock
-from threading import Thread
+from tmdbhelper.lib.files.futils import json_dumps
+from threading import Event, Lock, Semaphore, Thread
+from functools import lru_cache
+from collections import OrderedDict
+from json import loads as json_loads
 import time
 
+_SyncData = None
+
+
+def get_syncdata_class():
+    """Deferred SyncData import (pulls in the item database) resolved once per process"""
+    global _SyncData
+    if _SyncData is None:
+        from tmdbhelper.lib.api.trakt.sync.datasync import SyncData
+        _SyncData = SyncData
+    return _SyncData
+
+
 # Constants for better performance and maintainability
 API_ENDPOINTS = {
     'BASE': 'https://api.trakt.tv/',
@@ -30,13 +46,47 @@ BASE_HEADERS_TEMPLATE = {
     'Content-Type': 'application/json'
 }
 
+# Seconds before token expiry at which we stop trusting the local expiry check
+TOKEN_EXPIRY_SKEW = 60
+
+# Maximum number of GET responses memoized per TraktAPI instance
+GET_CACHE_MAXSIZE = 128
+
+# Seconds a memoized GET response is served before it is requested again
+GET_CACHE_TTL = 60
+
+# Only public endpoints whose response does not depend on the access token are memoized
+GET_CACHE_PUBLIC_PATHS = ('movies/', 'shows/', 'people/', 'search/', 'genres/', 'calendars/all/', 'lists/')
+
+
+def start_auth_thread(target):
+    """Background auth work runs on a daemon thread so a hung token refresh cannot hold up interpreter exit"""
+    thread = Thread(target=target, name='trakt-auth', daemon=True)
+    thread.start()
+    return thread
+
+
+@lru_cache(maxsize=2048)
+def get_cached_request_url(req_api_url, req_api_key, args, kwargs_items):
+    """Request url keyed on its parts - module level so the cache holds no reference to TraktAPI instances"""
+    url = '/'.join((req_api_url, '/'.join(map(str, (i for i in args if i is not None)))))
+    sep = '&' if '?' in url else '?'
+    if req_api_key:
+        url = sep.join((url, req_api_key))
+        sep = '&'
+    kws = '&'.join((f'{k}={v}' for k, v in kwargs_items if v is not None))
+    return sep.join((url, kws)) if kws else url
+
 
 class TraktAPI(NoCacheRequestAPI):
     """Optimized TraktAPI with improved caching, threading, and performance"""
     
     # Class-level shared window instance
     _shared_window = None
-    _window_lock = Thread()
+    _window_lock = Lock()
+
+    # In-process single-flight guard for background authorization checks
+    _auth_running = Semaphore(1)
     
     # Cached class attributes
     client_id = CLIENT_ID
@@ -56,64 +106,71 @@ class TraktAPI(NoCacheRequestAPI):
         TraktAPI.client_secret = client_secret or self.client_secret
         TraktAPI.user_token = user_token or self.user_token
         self.login_if_required = login_if_required
-        
+
+        # RequestAPI assigns headers=None which would shadow the cached_property
+        self.__dict__.pop('headers', None)
+
         # Cache frequently used values
-        self._cached_headers_base = None
-        self._last_auth_check = 0
         self._auth_cache_ttl = 5.0  # Cache auth status for 5 seconds
+        self._auth_cache_expiry = 0  # time.monotonic() deadline for cached auth status
+        self._auth_stale_window = 60.0  # Serve stale auth status for up to 60s while revalidating
+        self._auth_stale_expiry = 0
+        self._auth_refresh_inflight = Event()
         self._cached_auth_status = None
+        self._get_cache = OrderedDict()  # Short lived LRU of public GET response text - url -> (expiry, text)
+        self._get_cache_lock = Lock()
+        self._headers_by_token = {}
     
     @property
     def window(self):
-        """Cached window instance to avoid repeated instantiation"""
-        if TraktAPI._shared_window is None:
-            TraktAPI._shared_window = Window(10000)
-        return TraktAPI._shared_window
+        """Cached window instance shared across instances - double-checked locking on first use"""
+        window = TraktAPI._shared_window
+        if window is None:
+            with TraktAPI._window_lock:
+                window = TraktAPI._shared_window
+                if window is None:
+                    window = TraktAPI._shared_window = Window(10000)
+        return window
     
-    @property
+    @cached_property
     def headers_base(self):
         """Cached base headers to avoid repeated dict creation"""
-        if self._cached_headers_base is None:
-            self._cached_headers_base = BASE_HEADERS_TEMPLATE.copy()
-            self._cached_headers_base['trakt-api-key'] = self.client_id
-        return self._cached_headers_base
-    
-    @property
+        return {**BASE_HEADERS_TEMPLATE, 'trakt-api-key': self.client_id}
+
+    @cached_property
     def headers(self):
-        """Optimized headers with authentication"""
-        return self.get_headers(self.authenticator.access_token)
+        """Cached headers with authentication - invalidated on login/logout"""
+        auth_header_value = self.authenticator.auth_header_value
+        if not auth_header_value:
+            return self.headers_base
+        return {**self.headers_base, 'Authorization': auth_header_value}
 
     def get_headers(self, access_token=None):
-        """Optimized header generation with reduced dict operations"""
+        """Headers for access_token - built once per token and then served from cache"""
+        try:
+            return self._headers_by_token[access_token]
+        except KeyError:
+            pass
         headers = self.headers_base.copy()
         if access_token:
             headers['Authorization'] = f'Bearer {access_token}'
+        self._headers_by_token[access_token] = headers
         return headers
 
     def get_headers_authorization(self, access_token=None):
-        """Simplified authorization header generation"""
-        return {'Authorization': f'Bearer {access_token}'} if access_token else {}
-
-    @headers.setter
-    def headers(self, value):
-        """Headers setter - no-op for compatibility"""
-        return
+        """Authorization header - the current token reuses the authenticator's cached header value"""
+        if not access_token:
+            return {}
+        authenticator = self.authenticator
+        if access_token == authenticator.access_token:
+            return {'Authorization': authenticator.auth_header_value}
+        return {'Authorization': f'Bearer {access_token}'}
 
-    @cached_property
+    @threaded_cached_property
     def authenticator(self):
         """Cached authenticator instance"""
         return TraktAuthenticator(self)
 
-    @cached_property
-    def dialog_noapikey_header(self):
-        """Cached dialog header string"""
-        return f'{get_localized(32007)} {self.req_api_name} {get_localized(32011)}'
-
-    @cached_property
-    def dialog_noapikey_text(self):
-        """Cached dialog text string"""
-        return get_localized(32012)
-
     def get_device_code(self):
         """Get device code for OAuth flow"""
         return self.get_api_request_json(
@@ -159,22 +216,52 @@ class TraktAPI(NoCacheRequestAPI):
     @property
     def is_authorized(self):
         """Cached authorization status to reduce API calls"""
-        current_time = time.time()
-        
-        # Return cached result if within TTL
-        if (self._cached_auth_status is not None and 
-            current_time - self._last_auth_check < self._auth_cache_ttl):
+        # Return cached result if within TTL - single comparison against a precomputed deadline
+        now = time.monotonic()
+        if now < self._auth_cache_expiry:
             return self._cached_auth_status
-        
-        # Update cache
-        self._cached_auth_status = self.authenticator.is_authorized
-        self._last_auth_check = current_time
+
+        # Stale but recent - serve previous status and revalidate once in the background
+        if now < self._auth_stale_expiry:
+            if not self._auth_refresh_inflight.is_set():
+                self._auth_refresh_inflight.set()
+                start_auth_thread(self._refresh_auth_status_in_background)
+            return self._cached_auth_status
+
+        return self._refresh_auth_status()
+
+    @property
+    def is_token_fresh(self):
+        """Stored access token is present and clearly unexpired - checked locally without network"""
+        token_data = self.authenticator.token_data
+        if not token_data or not token_data.get('access_token'):
+            return False
+        try:
+            expires_at = token_data['created_at'] + token_data['expires_in']
+        except (KeyError, TypeError):
+            return False
+        return time.time() < expires_at - TOKEN_EXPIRY_SKEW
+
+    def _refresh_auth_status(self):
+        """Synchronously update cached authorization status"""
+        self._cached_auth_status = self.is_token_fresh or self.authenticator.is_authorized
+        self._auth_cache_expiry = time.monotonic() + self._auth_cache_ttl
+        self._auth_stale_expiry = self._auth_cache_expiry + self._auth_stale_window
         return self._cached_auth_status
 
+    def _refresh_auth_status_in_background(self):
+        """Single-flight background revalidation for stale-while-revalidate"""
+        try:
+            self._refresh_auth_status()
+        finally:
+            self._auth_refresh_inflight.clear()
+
     def invalidate_auth_cache(self):
         """Manually invalidate auth cache when needed"""
         self._cached_auth_status = None
-        self._last_auth_check = 0
+        self._auth_cache_expiry = 0
+        self._auth_stale_expiry = 0
+        self._headers_by_token.clear()
 
     def authorize(self, forced=False, background=False):
         """Optimized authorization with better background handling"""
@@ -211,44 +298,59 @@ class TraktAPI(NoCacheRequestAPI):
             return
 
         dialog_response = Dialog().yesnocustom(
-            self.dialog_noapikey_header,
-            self.dialog_noapikey_text,
+            f'{get_localized(32007)} {self.req_api_name} {get_localized(32011)}',
+            get_localized(32012),
             nolabel=get_localized(222),
             yeslabel=get_localized(186),
             customlabel=get_localized(13170)
         )
-        
-        # Use dict lookup for better performance than if/elif
-        response_handlers = {
-            1: self.login,
-            2: lambda: setattr(self, 'attempted_login', True)
-        }
 
-        handler = response_handlers.get(dialog_response)
-        if handler:
-            return handler()
+        if dialog_response == 1:
+            return self.login()
+        if dialog_response == 2:
+            self.attempted_login = True
+
+    def _reset_headers(self):
+        """Drop cached headers and responses tied to the current access token"""
+        self.__dict__.pop('headers', None)
+        self.__dict__.pop('headers_base', None)
+        self._headers_by_token.clear()
+        self._get_cache.clear()
+
+    def _reset_authenticator(self):
+        """Drop the cached authenticator so the next access builds a fresh one"""
+        self.__dict__.pop('authenticator', None)
+        self._reset_headers()
+
+    def get_request_url(self, *args, **kwargs):
+        """Memoized request url - sync loops assemble the same endpoint urls repeatedly"""
+        key = (self.req_api_url, self.req_api_key, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:  # Unhashable argument so build directly
+            return super().get_request_url(*args, **kwargs)
+        return get_cached_request_url(*key)
 
     def logout(self):
         """Optimized logout with cache invalidation"""
-        # Invalidate caches
         self.invalidate_auth_cache()
-        
-        # Reset authenticator
-        self.authenticator = TraktAuthenticator(self)
+        self._reset_authenticator()
         self.authenticator.logout()
+        self._reset_authenticator()
 
     def login(self):
         """Optimized login with cache invalidation"""
-        # Reset authenticator and caches
-        self.authenticator = TraktAuthenticator(self)
+        self._reset_authenticator()
         result = self.authenticator.login()
-        
+        self._reset_headers()
+
         # Invalidate auth cache to force refresh
         self.invalidate_auth_cache()
         return result
 
     def delete_response(self, *args, **kwargs):
         """Optimized DELETE request"""
+        self._get_cache.clear()
         return self.get_simple_api_request(
             self.get_request_url(*args, **kwargs),
             headers=self.headers,
@@ -257,12 +359,12 @@ class TraktAPI(NoCacheRequestAPI):
 
     def post_response(self, *args, postdata=None, response_method='post', **kwargs):
         """Optimized POST request with efficient JSON serialization"""
+        self._get_cache.clear()
         url = self.get_request_url(*args, **kwargs)
         
         # Only serialize postdata if it exists
         if postdata:
-            from tmdbhelper.lib.files.futils import json_dumps as data_dumps
-            postdata = data_dumps(postdata)
+            postdata = json_dumps(postdata)
         
         return self.get_simple_api_request(
             url,
@@ -271,6 +373,23 @@ class TraktAPI(NoCacheRequestAPI):
             method=response_method
         )
 
+    def post_batch(self, *args, items=None, response_method='post', **kwargs):
+        """
+        Send multiple sync items in a single request (e.g. sync/history, sync/collection)
+        items maps Trakt payload types to lists: {'movies': [...], 'shows': [...], 'episodes': [...]}
+        Duplicate items within a payload type are only posted once
+        """
+        postdata = {}
+        for payload_type, payload_items in (items or {}).items():
+            unique_items = {json_dumps(i): i for i in payload_items or ()}
+            if unique_items:
+                postdata[payload_type] = list(unique_items.values())
+
+        if not postdata:
+            return
+
+        return self.post_response(*args, postdata=postdata, response_method=response_method, **kwargs)
+
     def get_response(self, *args, **kwargs):
         """Optimized GET request"""
         return self.get_api_request(
@@ -278,18 +397,44 @@ class TraktAPI(NoCacheRequestAPI):
             headers=self.headers
         )
 
+    def _get_cached_text(self, url):
+        with self._get_cache_lock:
+            try:
+                expiry, text = self._get_cache[url]
+            except KeyError:
+                return
+            if time.monotonic() >= expiry:
+                del self._get_cache[url]
+                return
+            self._get_cache.move_to_end(url)
+            return text
+
+    def _set_cached_text(self, url, text):
+        with self._get_cache_lock:
+            self._get_cache[url] = (time.monotonic() + GET_CACHE_TTL, text)
+            self._get_cache.move_to_end(url)
+            while len(self._get_cache) > GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+
     def get_response_json(self, *args, **kwargs):
-        """Optimized JSON GET request with better error handling"""
+        """Optimized JSON GET request with better error handling and in-memory memoization"""
+        url = self.get_request_url(*args, **kwargs)
+        cacheable = url[len(API_ENDPOINTS['BASE']):].lstrip('/').startswith(GET_CACHE_PUBLIC_PATHS)
+
+        # Raw text is memoized and parsed per call so callers that mutate the response never share an object
+        text = self._get_cached_text(url) if cacheable else None
+        if text is not None:
+            return json_loads(text)
         try:
-            response = self.get_api_request(
-                self.get_request_url(*args, **kwargs), 
-                headers=self.headers
-            )
-            return response.json() if response else {}
+            response = self.get_api_request(url, headers=self.headers)
+            data = response.json() if response else {}
         except (ValueError, AttributeError):
             return {}
+        if data and cacheable:
+            self._set_cached_text(url, response.text)
+        return data
 
-    @cached_property
+    @threaded_cached_property
     def trakt_syncdata(self):
         """Cached sync data instance"""
         return self.get_trakt_syncdata()
@@ -298,19 +443,18 @@ class TraktAPI(NoCacheRequestAPI):
         """Get Trakt sync data if authorized"""
         if not self.is_authorized:
             return None
-        
-        from tmdbhelper.lib.api.trakt.sync.datasync import SyncData
-        return SyncData(self)
+        return get_syncdata_class()(self)
 
     def start_auth_in_background(self):
         """Optimized background authentication with proper thread management"""
-        # Check if auth check is already running
-        if self.window.getProperty(WINDOW_PROPERTIES['TRAKT_AUTH_RUNNING']) == 'True':
+        # Atomic check-and-set so concurrent callers cannot both start a check
+        if not TraktAPI._auth_running.acquire(blocking=False):
             return
-        
+
         def _run_auth_check():
             """Background auth check with proper cleanup"""
             try:
+                # Window property only advertises the running check to other add-on invocations
                 self.window.setProperty(WINDOW_PROPERTIES['TRAKT_AUTH_RUNNING'], 'True')
                 self.authorize(background=True)
             except Exception as e:
@@ -319,16 +463,14 @@ class TraktAPI(NoCacheRequestAPI):
                     self.kodi_log(f"Background auth check failed: {e}", level=2)
             finally:
                 self.window.setProperty(WINDOW_PROPERTIES['TRAKT_AUTH_RUNNING'], 'False')
+                TraktAPI._auth_running.release()
 
-        # Use daemon thread to avoid hanging on exit
-        auth_thread = Thread(target=_run_auth_check, daemon=True)
-        auth_thread.start()
+        start_auth_thread(_run_auth_check)
 
     def cleanup(self):
         """Cleanup method for proper resource management"""
         # Clear cached properties
-        if hasattr(self, '_cached_headers_base'):
-            self._cached_headers_base = None
+        self._reset_headers()
         
         # Invalidate auth cache
         self.invalidate_auth_cache()
@@ -27,10 +27,21 @@ class TraktAuthenticator:
     def authorization(self):
         return TraktStoredAccessToken(self.trakt_api).authorization
 
+    @cached_property
+    def token_data(self):
+        """Locally stored token data - read without refreshing or confirming with Trakt"""
+        return TraktStoredAccessToken(self.trakt_api).stored_authorization
+
     @property
     def access_token(self):
         return self.get_key(self.authorization, 'access_token')
 
+    @cached_property
+    def auth_header_value(self):
+        """Authorization header value formatted once per token - reset when authorization changes"""
+        access_token = self.access_token
+        return f'Bearer {access_token}' if access_token else None
+
     @property
     def is_authorized(self):
         return bool(self.access_token)
@@ -128,6 +139,7 @@ class TraktAuthenticator:
                 break
 
             self.authorization = self.trakt_api.get_authorisation_token(self.device_code)
+            self.__dict__.pop('auth_header_value', None)
 
             if self.authorization:
                 self.state = 'success'
@@ -4,14 +4,19 @@ import xbmcvfs
 import colorsys
 import hashlib
 import random
+import shutil
+import subprocess
 import threading
 import time
 from collections import OrderedDict, defaultdict
-from xbmc import getCacheThumbName, skinHasImage, Monitor, sleep
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from xbmc import getCacheThumbName, getSkinDir, skinHasImage, Monitor, sleep
 from tmdbhelper.lib.addon.plugin import get_infolabel, get_setting, get_condvisibility, ADDONDATA
 from jurialmunkey.window import WindowPropertySetter
 from jurialmunkey.parser import try_int, try_float
-from tmdbhelper.lib.files.futils import make_path
+from jurialmunkey.ftools import cached_property
+from tmdbhelper.lib.files.futils import make_path, read_file, write_file, json_loads, json_dumps
 from tmdbhelper.lib.addon.thread import SafeThread
 import urllib.request as urllib
 from tmdbhelper.lib.addon.logger import kodi_log
@@ -31,38 +36,150 @@ _cache_lock = threading.RLock()
 _processing_queue = {}
 _stats = {'cache_hits': 0, 'cache_misses': 0, 'compressions': 0, 'errors': 0}
 
+# Bounded worker pool shared by all image manipulations instead of a thread per item
+_IMG_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='tmdb-img')
+
+# Separate pool to evaluate the independent crop/blur/desaturate/colors manipulations of one item side by side
+_MANIPULATION_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tmdb-imgman')
+
+
+def _log_pool_error(future):
+    if future.cancelled() or not future.exception():
+        return
+    kodi_log(f'Image processing error: {future.exception()}', 2)
+
+
+def submit_image_task(func, *args, **kwargs):
+    """Schedule func on the image pool - runs inline like SafeThread if the pool no longer accepts work"""
+    try:
+        future = _IMG_POOL.submit(func, *args, **kwargs)
+    except RuntimeError:
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+    future.add_done_callback(_log_pool_error)
+    return future
+
+
 def md5hash(value):
     value = str(value).encode(errors='surrogatepass')
     return hashlib.md5(value).hexdigest()
 
 
+# Non-cryptographic hash for keys that never leave the process - md5hash stays for stable on-disk filenames
+try:
+    from xxhash import xxh3_64_hexdigest as _fasthash
+except ImportError:
+    def _fasthash(value):
+        return hashlib.blake2b(value, digest_size=8).hexdigest()
+
+
+def fasthash(value):
+    return _fasthash(str(value).encode(errors='surrogatepass'))
+
+
+class SmartImageCacheShard:
+    """
+    One segmented LRU partition of SmartImageCache
+    New entries wait in a probation FIFO and need a second touch to reach the protected segment
+    so images streamed past once while scrolling cannot flush the images being revisited
+    Lookups are lock free and only bump a saturating access_count - promotion and eviction happen under the lock
+    Protected entries are evicted lowest access_count first with counts halved once any saturates
+    """
+
+    access_count_max = 255
+
+    __slots__ = ('cache', 'probation', 'protected', 'lock', 'memory_usage', 'stats')
+
+    def __init__(self):
+        self.cache = {}  # Lookup index over both segments
+        self.probation = OrderedDict()
+        self.protected = {}  # Unordered - victims are chosen by access_count
+        self.lock = threading.RLock()
+        self.memory_usage = 0
+        self.stats = defaultdict(int)
+
+    def discard(self, cache_key):
+        """Drop cache_key from the index and memory accounting - call with lock held once popped from its segment"""
+        cache_entry = self.cache.pop(cache_key, None)
+        if cache_entry and isinstance(cache_entry.get('data'), bytes):
+            self.memory_usage -= len(cache_entry['data'])
+        return cache_entry
+
+    def get_protected_victim(self):
+        """Key of the least accessed protected entry - ages all counts by halving once any saturates"""
+        protected = self.protected
+        cache_key = min(protected, key=lambda k: protected[k]['access_count'])
+        if any(i['access_count'] >= self.access_count_max for i in protected.values()):
+            for i in protected.values():
+                i['access_count'] >>= 1
+        return cache_key
+
+    def promote(self, cache_key, cache_entry, protected_max):
+        """Move entry to protected and demote the least accessed protected entries to probation once over capacity"""
+        self.protected[cache_key] = cache_entry
+        while len(self.protected) > protected_max:
+            demoted_key = self.get_protected_victim()
+            demoted_entry = self.protected.pop(demoted_key)
+            demoted_entry['access_count'] = 1
+            self.probation[demoted_key] = demoted_entry
+
+    def evict(self, protected_max):
+        """Evict one entry from the probation head or else the least accessed protected entry - call with lock held"""
+        while self.probation:
+            cache_key, cache_entry = self.probation.popitem(last=False)
+            if cache_entry['access_count'] > 1:
+                self.promote(cache_key, cache_entry, protected_max)
+                continue
+            self.discard(cache_key)
+            self.stats['evictions'] += 1
+            return True
+        if not self.protected:
+            return False
+        cache_key = self.get_protected_victim()
+        del self.protected[cache_key]
+        self.discard(cache_key)
+        self.stats['evictions'] += 1
+        return True
+
+
 class SmartImageCache:
-    """Intelligent image caching with compression and LRU eviction"""
-    
+    """Intelligent image caching with compression and segmented LRU eviction"""
+
+    shard_count = 16  # Power of two so the shard index is a mask of the key hash
+
     def __init__(self, max_memory_mb=50, max_files=500):
         self.max_memory = max_memory_mb * 1024 * 1024  # Convert to bytes
         self.max_files = max_files
-        self.cache = OrderedDict()
-        self.memory_usage = 0
-        self.lock = threading.RLock()
-        self.stats = defaultdict(int)
-    
+        # Keys are spread over shards each with their own lock so image threads rarely contend
+        self.shards = [SmartImageCacheShard() for _ in range(self.shard_count)]
+        self.shard_mask = self.shard_count - 1
+        self.shard_max_memory = self.max_memory // self.shard_count
+        self.shard_max_files = max(1, max_files // self.shard_count)
+        self.shard_protected_max = max(1, self.shard_max_files - self.shard_max_files // 4)  # Quarter kept for probation
+
+    def get_shard(self, cache_key):
+        return self.shards[hash(cache_key) & self.shard_mask]
+
     def get_cache_key(self, source, method=None, params=None):
         """Generate cache key from source and parameters"""
         key_data = f"{source}:{method}:{str(params) if params else ''}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return fasthash(key_data)
     
     def get(self, cache_key):
         """Get cached image data"""
-        with self.lock:
-            if cache_key in self.cache:
-                # Move to end (most recently used)
-                self.cache.move_to_end(cache_key)
-                self.stats['hits'] += 1
-                return self.cache[cache_key]
-            
-            self.stats['misses'] += 1
+        shard = self.get_shard(cache_key)
+        cache_entry = shard.cache.get(cache_key)  # Single dict lookup is atomic so hits never take the lock
+        if cache_entry is None:
+            shard.stats['misses'] += 1  # Unlocked counters are approximate under contention
             return None
+        access_count = cache_entry['access_count']
+        if access_count < shard.access_count_max:
+            cache_entry['access_count'] = access_count + 1
+        shard.stats['hits'] += 1
+        return cache_entry
     
     def set(self, cache_key, image_data, file_path=None):
         """Cache image data with smart eviction"""
@@ -70,20 +187,24 @@ class SmartImageCache:
             return
             
         try:
-            with self.lock:
+            shard = self.get_shard(cache_key)
+            with shard.lock:
                 # Calculate memory usage
                 data_size = len(image_data) if isinstance(image_data, bytes) else 0
                 
+                # Replacing an existing key keeps its segment
+                segment = shard.probation
+                if cache_key in shard.cache:
+                    if shard.protected.pop(cache_key, None) is not None:
+                        segment = shard.protected
+                    shard.probation.pop(cache_key, None)
+                    shard.discard(cache_key)
+
                 # Evict if needed
-                while (len(self.cache) >= self.max_files or 
-                       self.memory_usage + data_size > self.max_memory):
-                    if not self.cache:
+                while (len(shard.cache) >= self.shard_max_files or
+                       shard.memory_usage + data_size > self.shard_max_memory):
+                    if not shard.evict(self.shard_protected_max):
                         break
-                    old_key = next(iter(self.cache))
-                    old_data = self.cache.pop(old_key)
-                    if isinstance(old_data.get('data'), bytes):
-                        self.memory_usage -= len(old_data['data'])
-                    self.stats['evictions'] += 1
                 
                 # Cache new data
                 cache_entry = {
@@ -93,67 +214,99 @@ class SmartImageCache:
                     'access_count': 1
                 }
                 
-                self.cache[cache_key] = cache_entry
-                self.memory_usage += data_size
+                shard.cache[cache_key] = cache_entry
+                segment[cache_key] = cache_entry
+                shard.memory_usage += data_size
                 
         except Exception as e:
             kodi_log(f'SmartImageCache: Error caching image: {e}', 1)
     
     def clear(self):
         """Clear all cached data"""
-        with self.lock:
-            self.cache.clear()
-            self.memory_usage = 0
+        for shard in self.shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.probation.clear()
+                shard.protected.clear()
+                shard.memory_usage = 0
     
     def get_stats(self):
-        """Get cache statistics"""
-        with self.lock:
-            total_requests = self.stats['hits'] + self.stats['misses']
-            hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-            
-            return {
-                'entries': len(self.cache),
-                'memory_mb': round(self.memory_usage / (1024 * 1024), 2),
-                'hit_rate': f"{hit_rate:.1f}%",
-                **dict(self.stats)
-            }
+        """Get cache statistics - a snapshot summed across shards without locking"""
+        stats = defaultdict(int)
+        entries = memory_usage = 0
+        for shard in self.shards:
+            entries += len(shard.cache)
+            memory_usage += shard.memory_usage
+            for k, v in list(shard.stats.items()):
+                stats[k] += v
+
+        total_requests = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'entries': entries,
+            'memory_mb': round(memory_usage / (1024 * 1024), 2),
+            'hit_rate': f"{hit_rate:.1f}%",
+            **dict(stats)
+        }
 
 # Global smart image cache
 _smart_cache = SmartImageCache()
 
 
-def _optimize_image_format(img, quality=85):
+# Runtime cache writes favour fast encoding - final_output restores the slower size optimising search
+PNG_SAVE_PARAMS = {'format': 'PNG', 'compress_level': 1}
+PNG_SAVE_PARAMS_FINAL = {'format': 'PNG', 'optimize': True}
+JPEG_SAVE_PARAMS = {'format': 'JPEG', 'optimize': False, 'subsampling': 2}
+JPEG_SAVE_PARAMS_FINAL = {'format': 'JPEG', 'optimize': True}
+
+
+def _optimize_image_params(img, quality=85, final_output=False):
+    """Returns (img, save_kwargs, ext) for the optimal format - img is converted to RGB for JPEG"""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Images with transparency -> PNG
+        return img, PNG_SAVE_PARAMS_FINAL if final_output else PNG_SAVE_PARAMS, '.png'
+    # Photos/solid images -> JPEG with compression
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    save_kwargs = JPEG_SAVE_PARAMS_FINAL if final_output else JPEG_SAVE_PARAMS
+    return img, {'quality': quality, **save_kwargs}, '.jpg'
+
+
+def _optimize_image_format(img, quality=85, final_output=False):
     """Optimize image format and compression"""
     try:
-        # Convert to optimal format
-        if img.mode in ('RGBA', 'LA', 'P'):
-            # Images with transparency -> PNG with optimization
-            output = io.BytesIO()
-            img.save(output, format='PNG', optimize=True)
-            return output.getvalue(), '.png'
-        else:
-            # Photos/solid images -> JPEG with compression
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            output = io.BytesIO()
-            img.save(output, format='JPEG', quality=quality, optimize=True)
-            return output.getvalue(), '.jpg'
+        img, save_kwargs, ext = _optimize_image_params(img, quality, final_output)
+        output = io.BytesIO()
+        img.save(output, **save_kwargs)
+        return output.getvalue(), ext
     except Exception as e:
         kodi_log(f'Image optimization error: {e}', 1)
         return None, None
 
 
-def _saveimage(img, destination, optimize=True):
+def _saveimage(img, destination, optimize=True, final_output=False):
     """Save image with optimization"""
+    global _stats
     try:
         if optimize:
-            # Get optimized data
-            optimized_data, ext = _optimize_image_format(img)
+            translated = xbmcvfs.translatePath(destination)
+            if '://' not in translated:
+                # Local path so let Pillow's encoder write straight to the file without an intermediate buffer
+                try:
+                    img, save_kwargs, ext = _optimize_image_params(img, final_output=final_output)
+                    img.save(translated, **save_kwargs)
+                    _stats['compressions'] += 1
+                    return True
+                except Exception as e:
+                    kodi_log(f'Image optimization error: {e}', 1)
+
+            # Get optimized data for VFS destinations (smb://, nfs:// etc)
+            optimized_data, ext = _optimize_image_format(img, final_output=final_output)
             if optimized_data:
                 # Save optimized version
                 with xbmcvfs.File(destination, 'wb') as f:
                     f.write(optimized_data)
-                global _stats
                 _stats['compressions'] += 1
                 return True
         
@@ -166,9 +319,24 @@ def _saveimage(img, destination, optimize=True):
         return False
 
 
-def _imageopen(image):
-    """Open image with smart caching"""
-    cache_key = md5hash(f"open:{image}")
+def _imageopen(image, cache_key=None, load=False):
+    """
+    Open image with smart caching - cache_key can be passed when the caller already has a source hash
+    Pass load=True for files that are deleted after use so that the local file handle is released before returning
+    """
+    # Local files are opened lazily by Pillow from disk - the OS page cache makes keeping their bytes redundant
+    translated = xbmcvfs.translatePath(image)
+    if '://' not in translated:
+        try:
+            img = Image.open(translated)
+            if load:
+                img.load()
+            return img
+        except Exception as e:
+            kodi_log(f'Image open error for {image}: {e}', 2)
+            return None
+
+    cache_key = cache_key or fasthash(f"open:{image}")
     
     # Check smart cache first
     cached_data = _smart_cache.get(cache_key)
@@ -207,45 +375,96 @@ def _closeimage(image, targetfile=None):
             pass
 
 
-def _openimage(image, targetpath, filename):
-    """ Optimized image open helper with smart caching """
-    cache_key = md5hash(f"openimage:{image}:{targetpath}:{filename}")
+@lru_cache(maxsize=2048)
+def _cached_thumb_name(path):
+    return getCacheThumbName(path)
+
+
+@lru_cache(maxsize=2048)
+def _cached_skin_has_image(image, skin_dir):
+    """skin_dir is only part of the cache key so answers from a previous skin are not reused after a skin change"""
+    return skinHasImage(image)
+
+
+THUMBNAILS_LISTDIR_TTL = 5  # Seconds before a thumbnail directory listing is re-read to pick up new cache files
+
+
+@lru_cache(maxsize=16)
+def _list_thumbnail_files(directory, ttl_bucket):
+    """Filenames in a Kodi thumbnail directory - ttl_bucket is only part of the cache key so listings expire"""
+    try:
+        return frozenset(xbmcvfs.listdir(directory)[1])
+    except Exception:
+        return frozenset()
+
+
+def _find_cached_thumbnails(path):
+    """Yields existing Kodi texture cache files for cache thumb name path using one listing per directory"""
+    ttl_bucket = int(time.monotonic() // THUMBNAILS_LISTDIR_TTL)
+    directory = f'special://profile/Thumbnails/{path[0]}/'
+    files = _list_thumbnail_files(directory, ttl_bucket)
+    for filename in (f'{path[:-4]}.jpg', f'{path[:-4]}.png'):
+        if filename in files:
+            yield f'{directory}{filename}'
+    directory = f'special://profile/Thumbnails/Video/{path[0]}/'
+    if path in _list_thumbnail_files(directory, ttl_bucket):
+        yield f'{directory}{path}'
+
+
+class _ThumbnailMiss(Exception):
+    """Raised by _resolve_cached_thumbnail on a miss so that lru_cache only memoizes found thumbnails"""
+
+
+@lru_cache(maxsize=512)
+def _resolve_cached_thumbnail(image):
+    """Returns (cache, translated_path) of the first texture cache file for image - get_cached_thumbnail checks it still exists"""
+    cached_image_path = urllib.unquote(image.replace('image://', ''))
+    if cached_image_path.endswith('/'):
+        cached_image_path = cached_image_path[:-1]
+    for path in (_cached_thumb_name(cached_image_path), _cached_thumb_name(image)):
+        for cache in _find_cached_thumbnails(path):
+            return cache, xbmcvfs.translatePath(cache)
+    raise _ThumbnailMiss(image)
+
+
+def get_cached_thumbnail(image):
+    try:
+        cache, translated_cache = _resolve_cached_thumbnail(image)
+    except _ThumbnailMiss:
+        return None, None
+    if os.path.exists(translated_cache):
+        return cache, translated_cache
+    # Kodi's texture cleanup removed the file so forget every resolved path rather than serve more stale ones
+    _resolve_cached_thumbnail.cache_clear()
+    return None, None
+
+
+def _openimage(image, targetpath, filename, image_hash=None):
+    """ Optimized image open helper with smart caching - pass image_hash to reuse the caller's source hash """
+    if image_hash:
+        cache_key = f"openimage:{image_hash}:{targetpath}{filename}"
+    else:
+        cache_key = fasthash(f"openimage:{image}:{targetpath}:{filename}")
     
     # Check smart cache
     cached_result = _smart_cache.get(cache_key)
     if cached_result and cached_result.get('image_obj'):
         return cached_result['image_obj'], None
     
-    cached_image_path = urllib.unquote(image.replace('image://', ''))
-    if cached_image_path.endswith('/'):
-        cached_image_path = cached_image_path[:-1]
-
-    # Optimized cache file search
-    cache_paths = [
-        getCacheThumbName(cached_image_path),
-        getCacheThumbName(image)
-    ]
-    
-    for path in cache_paths:
-        cache_locations = [
-            os.path.join('special://profile/Thumbnails/', path[0], path[:-4] + '.jpg'),
-            os.path.join('special://profile/Thumbnails/', path[0], path[:-4] + '.png'),
-            os.path.join('special://profile/Thumbnails/Video/', path[0], path)
-        ]
-        
-        for cache in cache_locations:
-            if xbmcvfs.exists(cache):
-                try:
-                    img = _imageopen(xbmcvfs.translatePath(cache))
-                    if img:
-                        # Cache the successful result
-                        _smart_cache.set(cache_key, None, cache)
-                        return img, None
-                except Exception as error:
-                    kodi_log('Image error: Could not open cached image --> %s' % error, 2)
+    # Texture cache lookup - repeated focus on the same image is a memoized hit
+    cache, translated_cache = get_cached_thumbnail(image)
+    if cache:
+        try:
+            img = _imageopen(translated_cache, cache_key=f"open:{image_hash}" if image_hash else None)
+            if img:
+                # Cache the successful result
+                _smart_cache.set(cache_key, None, cache)
+                return img, None
+        except Exception as error:
+            kodi_log('Image error: Could not open cached image --> %s' % error, 2)
 
     # Handle skin images
-    if skinHasImage(image):
+    if _cached_skin_has_image(image, getSkinDir()):
         if not image.startswith('special://skin'):
             image = os.path.join('special://skin/media/', image)
         try:
@@ -266,7 +485,7 @@ def _openimage(image, targetpath, filename):
             return '', None
             
     try:
-        img = _imageopen(targetfile)
+        img = _imageopen(targetfile, load=True)
         if img:
             return img, targetfile
     except Exception as error:
@@ -276,12 +495,18 @@ def _openimage(image, targetpath, filename):
 
 
 class ImageProcessingQueue:
-    """Async image processing queue to prevent blocking"""
+    """
+    Async image processing queue to prevent blocking
+    Identical work is single-flight: the first caller installs a Future in processing and later callers wait on it
+    """
+
+    completed_max = 512
     
-    def __init__(self, max_workers=3):
+    def __init__(self, max_workers=3, wait_timeout=0.05):
         self.max_workers = max_workers
-        self.processing = {}
-        self.completed = {}
+        self.wait_timeout = wait_timeout
+        self.processing = {}  # task_key -> Future of in-flight work
+        self.completed = OrderedDict()  # LRU of completed results bounded by completed_max
         self.lock = threading.Lock()
         
     def is_processing(self, task_key):
@@ -290,74 +515,120 @@ class ImageProcessingQueue:
     
     def get_completed(self, task_key):
         with self.lock:
-            return self.completed.get(task_key)
+            result = self.completed.get(task_key)
+            if result is not None:
+                self.completed.move_to_end(task_key)
+            return result
     
+    def set_completed(self, task_key, result):
+        """Store completed result and drop the least recently used beyond completed_max - call with lock held"""
+        self.completed[task_key] = result
+        self.completed.move_to_end(task_key)
+        while len(self.completed) > self.completed_max:
+            self.completed.popitem(last=False)
+
+    def claim(self, task_key):
+        """Returns (future, is_owner) - is_owner is True when the caller installed the future and must resolve it"""
+        with self.lock:
+            future = self.processing.get(task_key)
+            if future is not None:
+                return future, False
+            future = self.processing[task_key] = Future()
+            return future, True
+
+    def resolve(self, task_key, future, func, *args, publish=True, **kwargs):
+        """
+        Run func as the single worker for task_key and publish its outcome to every waiter
+        publish=False only shares the result with current waiters and does not store it in completed
+        """
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            with self.lock:
+                self.processing.pop(task_key, None)
+            future.set_exception(exc)
+            return
+        with self.lock:
+            if publish:
+                self.set_completed(task_key, result)
+            self.processing.pop(task_key, None)
+        future.set_result(result)
+
+    def run_once(self, task_key, func, *args, **kwargs):
+        """
+        Run func inline unless identical work is already in flight
+        Waiters raise FutureTimeoutError if the owner has not finished within wait_timeout
+        Results are not kept in completed so that the next focus reruns func and its property side effects
+        """
+        future, is_owner = self.claim(task_key)
+        if is_owner:
+            self.resolve(task_key, future, func, *args, publish=False, **kwargs)
+            return future.result()
+        return future.result(timeout=self.wait_timeout)
+
     def add_task(self, task_key, func, *args, **kwargs):
-        """Add task to processing queue"""
+        """Add task to processing queue and return its future or None if already completed"""
         with self.lock:
-            if task_key in self.processing or task_key in self.completed:
+            if task_key in self.completed:
                 return
-            
-            # Clean up old completed tasks
-            if len(self.completed) > 100:
-                # Keep only the 50 most recent
-                items = list(self.completed.items())[-50:]
-                self.completed = dict(items)
-            
-            self.processing[task_key] = True
-            
+        future, is_owner = self.claim(task_key)
+        if not is_owner:
+            return future
+
         # Start processing in background
         def _process():
-            try:
-                result = func(*args, **kwargs)
-                with self.lock:
-                    self.completed[task_key] = result
-                    self.processing.pop(task_key, None)
-            except Exception as e:
-                with self.lock:
-                    self.processing.pop(task_key, None)
-                kodi_log(f'Image processing error: {e}', 2)
-        
-        thread = SafeThread(target=_process)
-        thread.start()
+            self.resolve(task_key, future, func, *args, **kwargs)
+            if future.exception():
+                kodi_log(f'Image processing error: {future.exception()}', 2)
+
+        submit_image_task(_process)
+        return future
 
 # Global processing queue
 _processing_queue = ImageProcessingQueue()
 
 
-class ImageFunctions(SafeThread, WindowPropertySetter):
+@lru_cache(maxsize=None)
+def _get_save_path(folder):
+    """Storage path for one manipulation folder - created once and recreated after clear_image_caches"""
+    return make_path(ImageFunctions.save_path.format(folder))
+
+
+class ImageFunctions(WindowPropertySetter):
     save_path = f"{get_setting('image_location', 'str') or ADDONDATA}{{}}/"
     blur_size = try_int(get_infolabel('Skin.String(TMDbHelper.Blur.Size)')) or 480
     crop_size = (800, 310)
     radius = try_int(get_infolabel('Skin.String(TMDbHelper.Blur.Radius)')) or 40
 
     def __init__(self, method=None, artwork=None, is_thread=True, prefix='ListItem'):
-        if is_thread:
-            SafeThread.__init__(self)
+        # is_thread is kept for callers - background work is now scheduled with submit() on the shared pool
         self.image = artwork
+        self.method = method
         self.func = None
+        self.process = None  # Pillow work only - colors leaves its Main/Comp properties to finish()
         self.save_orig = False
         self.save_prop = None
         self.cache_key = None
         
         if method == 'blur':
-            self.func = self.blur
-            self.save_path = make_path(self.save_path.format('blur_v3'))
+            self.func = self.process = self.blur
+            self.save_path = _get_save_path('blur_v3')
             self.save_prop = f'{prefix}.BlurImage'
             self.save_orig = True
         elif method == 'crop':
-            self.func = self.crop
-            self.save_path = make_path(self.save_path.format('crop_v3'))
+            self.func = self.process = self.crop
+            self.save_path = _get_save_path('crop_v3')
             self.save_prop = f'{prefix}.CropImage'
             self.save_orig = True
         elif method == 'desaturate':
-            self.func = self.desaturate
-            self.save_path = make_path(self.save_path.format('desaturate_v3'))
+            self.func = self.process = self.desaturate
+            self.save_path = _get_save_path('desaturate_v3')
             self.save_prop = f'{prefix}.DesaturateImage'
             self.save_orig = True
         elif method == 'colors':
             self.func = self.colors
-            self.save_path = make_path(self.save_path.format('colors_v3'))
+            self.process = self.get_colors
+            self.save_path = _get_save_path('colors_v3')
             self.save_prop = f'{prefix}.Colors'
 
         # Generate cache key for smart caching
@@ -369,23 +640,30 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
             }
             self.cache_key = _smart_cache.get_cache_key(self.image, method, params)
 
+    def submit(self):
+        return submit_image_task(self.run)
+
     def run(self):
         if not self.save_prop or not self.func:
             return
             
-        # Check if we're already processing this
-        if self.cache_key and _processing_queue.is_processing(self.cache_key):
-            return
-            
         # Check for completed result
         if self.cache_key:
             completed_result = _processing_queue.get_completed(self.cache_key)
             if completed_result:
                 self.set_properties(completed_result)
                 return
-        
-        # Process the image
-        output = self.func(self.image) if self.image else None
+
+        # Process the image - identical in-flight work is shared rather than repeated
+        if not self.image:
+            output = None
+        elif self.cache_key:
+            try:
+                output = _processing_queue.run_once(self.cache_key, self.func, self.image)
+            except FutureTimeoutError:
+                return  # Owner of the in-flight work sets the properties when it finishes
+        else:
+            output = self.func(self.image)
         self.set_properties(output)
 
     def set_properties(self, output):
@@ -396,6 +674,16 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
         self.get_property(self.save_prop, output)
         self.get_property(f'{self.save_prop}.Original', self.image) if self.save_orig else None
 
+    @cached_property
+    def image_hash(self):
+        return md5hash(self.image)
+
+    def get_source_hash(self, source):
+        """Reuse the artwork hash when processing self.image - shared by filenames and smart cache keys"""
+        if source == self.image:
+            return self.image_hash
+        return md5hash(source)
+
     def clamp(self, x):
         return max(0, min(x, 255))
 
@@ -410,12 +698,13 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
                 if xbmcvfs.exists(cached_result['file_path']):
                     return cached_result['file_path']
         
-        filename = f'cropped-{md5hash(source)}.png'
+        source_hash = self.get_source_hash(source)
+        filename = f'cropped-{source_hash}.png'
         destination = os.path.join(self.save_path, filename)
         
         try:
             if not xbmcvfs.exists(destination):
-                img, targetfile = _openimage(source, self.save_path, filename)
+                img, targetfile = _openimage(source, self.save_path, filename, image_hash=source_hash)
                 if not img or img == '':
                     return ''
                     
@@ -460,17 +749,23 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
                 if xbmcvfs.exists(cached_result['file_path']):
                     return cached_result['file_path']
         
-        filename = f'{md5hash(source)}-{self.radius}-{self.blur_size}.jpg'
+        source_hash = self.get_source_hash(source)
+        filename = f'{source_hash}-{self.radius}-{self.blur_size}.jpg'
         destination = os.path.join(self.save_path, filename)
         
         try:
             if not xbmcvfs.exists(destination):
-                img, targetfile = _openimage(source, self.save_path, filename)
+                img, targetfile = _openimage(source, self.save_path, filename, image_hash=source_hash)
                 if not img or img == '':
                     return ''
                     
-                # Optimize thumbnail operation
-                img.thumbnail((self.blur_size, self.blur_size), Image.Resampling.LANCZOS)
+                # Integer box reduce in C first - the output is blurred so a LANCZOS downscale of the full image is wasted work
+                if img.mode not in ('RGB', 'RGBA', 'L'):
+                    img = img.convert('RGB')
+                factor = max(img.size) // self.blur_size
+                if factor > 1:
+                    img = img.reduce(factor)
+                img.thumbnail((self.blur_size, self.blur_size), Image.Resampling.BILINEAR)
                 img = img.convert('RGB')
                 
                 # Apply blur
@@ -505,12 +800,13 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
                 if xbmcvfs.exists(cached_result['file_path']):
                     return cached_result['file_path']
         
-        filename = f'{md5hash(source)}.png'
+        source_hash = self.get_source_hash(source)
+        filename = f'{source_hash}.png'
         destination = os.path.join(self.save_path, filename)
         
         try:
             if not xbmcvfs.exists(destination):
-                img, targetfile = _openimage(source, self.save_path, filename)
+                img, targetfile = _openimage(source, self.save_path, filename, image_hash=source_hash)
                 if not img or img == '':
                     return ''
                     
@@ -534,28 +830,39 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
             _stats['errors'] += 1
             return ''
 
-    def get_maincolor(self, img):
-        rgb_list = [None, None, None]
-        for channel in range(3):
-            pixels = img.getdata(band=channel)
-            values = [pixel for pixel in pixels]
-            rgb_list[channel] = self.clamp(sum(values) / len(values))
-        return rgb_list
+    def get_maincolor(self, img, colors=4):
+        # Dominant colour is the most populous entry of a small octree palette built in Pillow's C core
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        if not img.width or not img.height:
+            return [0, 0, 0]
+        quantized = img.quantize(colors=colors, method=Image.Quantize.FASTOCTREE)
+        palette = quantized.getpalette()
+        histogram = quantized.histogram()
+        x = max(range(min(colors, len(palette) // 3)), key=histogram.__getitem__) * 3
+        return [self.clamp(i) for i in palette[x:x + 3]]
 
     def get_compcolor(self, r, g, b, shift=0.33):
         hls_tuple = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
         rgb_tuple = colorsys.hls_to_rgb(abs(hls_tuple[0] - shift), hls_tuple[1], hls_tuple[2])
         return self.rgb_to_int(*rgb_tuple)
 
-    def get_color_lumsat(self, r, g, b):
+    def get_color_overrides(self):
+        """Skin luminance and saturation overrides - read on each colors() call so skin changes apply immediately"""
+        return (
+            try_float(get_infolabel('Skin.String(TMDbHelper.Colors.Luminance)')),
+            try_float(get_infolabel('Skin.String(TMDbHelper.Colors.Saturation)')))
+
+    def get_color_lumsat(self, r, g, b, overrides=None):
+        luminance, saturation = overrides or self.get_color_overrides()
         hls_tuple = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
         hue = hls_tuple[0]
-        lum = try_float(get_infolabel('Skin.String(TMDbHelper.Colors.Luminance)')) or hls_tuple[1]
-        sat = try_float(get_infolabel('Skin.String(TMDbHelper.Colors.Saturation)')) or hls_tuple[2]
+        lum = luminance or hls_tuple[1]
+        sat = saturation or hls_tuple[2]
         return self.rgb_to_int(*colorsys.hls_to_rgb(hue, lum, sat))
 
     def rgb_to_int(self, r, g, b):
-        return [try_int(self.clamp(i * 255)) for i in [r, g, b]]
+        return [0 if i < 0 else 255 if i > 255 else int(i) for i in (r * 255, g * 255, b * 255)]
 
     def rgb_to_hex(self, r, g, b):
         return f'FF{r:02x}{g:02x}{b:02x}'
@@ -575,96 +882,107 @@ class ImageFunctions(SafeThread, WindowPropertySetter):
         inc_r = (rgb_z[0] - rgb_a[0]) // steps
         inc_g = (rgb_z[1] - rgb_a[1]) // steps
         inc_b = (rgb_z[2] - rgb_a[2]) // steps
-        val_r = rgb_a[0]
-        val_g = rgb_a[1]
-        val_b = rgb_a[2]
-        for i in range(steps):
+        hex_values = [
+            self.rgb_to_hex(rgb_a[0] + inc_r * i, rgb_a[1] + inc_g * i, rgb_a[2] + inc_b * i)
+            for i in range(steps)]
+        monitor = Monitor()
+        for hex_value in hex_values:
             if self.get_property(checkprop) != start_hex:
                 return
-            hex_value = self.rgb_to_hex(val_r, val_g, val_b)
             self.get_property(propname, set_property=hex_value)
-            val_r = val_r + inc_r
-            val_g = val_g + inc_g
-            val_b = val_b + inc_b
-            Monitor().waitForAbort(0.05)
+            monitor.waitForAbort(0.05)
         self.get_property(propname, set_property=end_hex)
         return end_hex
 
-    def colors(self, source):
+    def get_colors(self, source):
+        """Returns (maincolor_hex, compcolor_hex) for source without setting any window properties"""
         if not source:
-            return ''
-            
+            return
+
         # Check smart cache first
         if self.cache_key:
             cached_result = _smart_cache.get(self.cache_key)
             if cached_result and cached_result.get('data'):
-                try:
-                    # Return cached color data
-                    return cached_result['data']
-                except Exception:
-                    pass
-        
-        filename = f'{md5hash(source)}.png'
+                return cached_result['data']
+
+        source_hash = self.get_source_hash(source)
+        filename = f'{source_hash}.png'
         destination = self.save_path + filename
         targetfile = None
-        
+
         try:
             if xbmcvfs.exists(destination):
                 img = _imageopen(xbmcvfs.translatePath(destination))
             else:
-                img, targetfile = _openimage(source, self.save_path, filename)
+                img, targetfile = _openimage(source, self.save_path, filename, image_hash=source_hash)
                 if not img or img == '':
-                    return ''
-                    
-                img.thumbnail((128, 128), Image.Resampling.LANCZOS)
+                    return
+
+                img.thumbnail((32, 32), Image.Resampling.BILINEAR)  # Colour sampling needs few pixels and no sharp filter
                 img = img.convert('RGB')
                 _saveimage(img, destination, optimize=True)
-                
+
             if not img:
-                return ''
-                
+                return
+
+            overrides = self.get_color_overrides()
             maincolor_rgb = self.get_maincolor(img)
-            maincolor_hex = self.rgb_to_hex(*self.get_color_lumsat(*maincolor_rgb))
+            maincolor_hex = self.rgb_to_hex(*self.get_color_lumsat(*maincolor_rgb, overrides=overrides))
             compcolor_rgb = self.get_compcolor(*maincolor_rgb)
-            compcolor_hex = self.rgb_to_hex(*self.get_color_lumsat(*compcolor_rgb))
-            
+            compcolor_hex = self.rgb_to_hex(*self.get_color_lumsat(*compcolor_rgb, overrides=overrides))
+            _closeimage(img, targetfile)
+
             # Cache the color result
             if self.cache_key:
-                _smart_cache.set(self.cache_key, maincolor_hex, destination)
-            
-            # Set color properties with gradients
-            maincolor_propname = self.save_prop + '.Main'
-            maincolor_propchek = self.save_prop + '.MainCheck'
-            maincolor_propvalu = self.get_property(maincolor_propname)
-            
-            if not maincolor_propvalu:
-                self.get_property(maincolor_propname, set_property=maincolor_hex)
-            else:
-                self.get_property(maincolor_propchek, set_property=maincolor_propvalu)
-                thread_maincolor = SafeThread(target=self.set_prop_colorgradient, args=[
-                    maincolor_propname, maincolor_propvalu, maincolor_hex, maincolor_propchek])
-                thread_maincolor.start()
-                
-            compcolor_propname = self.save_prop + '.Comp'
-            compcolor_propchek = self.save_prop + '.CompCheck'
-            compcolor_propvalu = self.get_property(compcolor_propname)
-            
-            if not compcolor_propvalu:
-                self.get_property(compcolor_propname, set_property=compcolor_hex)
-            else:
-                self.get_property(compcolor_propchek, set_property=compcolor_propvalu)
-                thread_compcolor = SafeThread(target=self.set_prop_colorgradient, args=[
-                    compcolor_propname, compcolor_propvalu, compcolor_hex, compcolor_propchek])
-                thread_compcolor.start()
-                
-            _closeimage(img, targetfile)
-            return maincolor_hex
-            
+                _smart_cache.set(self.cache_key, (maincolor_hex, compcolor_hex), destination)
+
+            return maincolor_hex, compcolor_hex
+
         except Exception as exc:
             kodi_log(f'Colors Error: {exc}', 1)
             global _stats
             _stats['errors'] += 1
+            return
+
+    def set_color_properties(self, maincolor_hex, compcolor_hex):
+        """Set Main/Comp colour properties - fading from any previous colour on gradient threads"""
+        for suffix, color_hex in (('Main', maincolor_hex), ('Comp', compcolor_hex)):
+            propname = f'{self.save_prop}.{suffix}'
+            propchek = f'{propname}Check'
+            propvalu = self.get_property(propname)
+            if not propvalu:
+                self.get_property(propname, set_property=color_hex)
+                continue
+            self.get_property(propchek, set_property=propvalu)
+            thread_color = SafeThread(target=self.set_prop_colorgradient, args=[
+                propname, propvalu, color_hex, propchek])
+            thread_color.start()
+
+    def colors(self, source):
+        colors = self.get_colors(source)
+        if not colors:
             return ''
+        self.set_color_properties(*colors)
+        return colors[0]
+
+    def finish(self, result):
+        """Turn a process() result into the output value - call on the thread that owns the window properties"""
+        if self.method != 'colors' or not result:
+            return result
+        self.set_color_properties(*result)
+        return result[0]
+
+
+_IMAGE_KEY_CACHE = {}
+
+
+def _get_image_keys(method):
+    """Returns the (image, image.original) result keys for method - built once per method"""
+    try:
+        return _IMAGE_KEY_CACHE[method]
+    except KeyError:
+        keys = _IMAGE_KEY_CACHE[method] = (f'{method}image', f'{method}image.original')
+        return keys
 
 
 class ImageArtworkGetter():
@@ -763,6 +1081,37 @@ class ImageManipulations(WindowPropertySetter):
             if img_get.artwork_fallback:
                 return img_get.artwork_fallback
 
+    def get_image_manipulation(self, manipulation):
+        """Returns (method, imgfunc) for an active manipulation with artwork - reads Kodi state so call on the calling thread"""
+        if not manipulation['active']():
+            return
+
+        method = manipulation['method']
+        imgfunc = ImageFunctions(method=method, is_thread=False, artwork=manipulation['images']())
+        if not imgfunc.image or not imgfunc.process:
+            return
+        return method, imgfunc
+
+    @staticmethod
+    def process_image_manipulation(method, imgfunc):
+        """Pillow work for one manipulation - returns None if identical work is still in flight"""
+        task_key = f"{method}_{fasthash(imgfunc.image)}"
+
+        # Check for completed result
+        completed_result = _processing_queue.get_completed(task_key)
+        if completed_result:
+            return completed_result
+
+        # For immediate response, try synchronous processing first
+        try:
+            return _processing_queue.run_once(task_key, imgfunc.process, imgfunc.image)
+        except FutureTimeoutError:
+            return  # Identical work still in flight on another thread
+        except Exception as e:
+            kodi_log(f'Image manipulation error for {method}: {e}', 2)
+            # Queue for async processing as fallback
+            _processing_queue.add_task(task_key, imgfunc.process, imgfunc.image)
+
     def get_image_manipulations(self, use_winprops=False, built_artwork=None, allow_list=('crop', 'blur', 'desaturate', 'colors', )):
         images = {}
         _manipulations = (
@@ -794,44 +1143,23 @@ class ImageManipulations(WindowPropertySetter):
                     built_artwork=built_artwork)
                 or self.get_property('Colors.Fallback')},)
 
-        for i in _manipulations:
-            if i['method'] not in allow_list:
-                continue
-            if not i['active']():
-                continue
-                
-            # Use async processing for better performance
-            task_key = f"{i['method']}_{md5hash(str(i['images']()))}"
-            
-            # Check if already processing
-            if _processing_queue.is_processing(task_key):
-                continue
-                
-            # Check for completed result
-            completed_result = _processing_queue.get_completed(task_key)
-            if completed_result:
-                images[f'{i["method"]}image'] = completed_result
-                images[f'{i["method"]}image.original'] = i['images']()
-                if use_winprops:
-                    imgfunc = ImageFunctions(method=i['method'], is_thread=False, artwork=i['images']())
-                    imgfunc.set_properties(completed_result)
+        # Conditions, infolabels and window properties are read and set here - only the Pillow work goes to the pool
+        tasks = (self.get_image_manipulation(i) for i in _manipulations if i['method'] in allow_list)
+        futures = {
+            _MANIPULATION_POOL.submit(self.process_image_manipulation, *task): task
+            for task in tasks if task}
+
+        for future in as_completed(futures):
+            result = future.result()
+            if not result:
                 continue
-            
-            # Create image function and process
-            imgfunc = ImageFunctions(method=i['method'], is_thread=False, artwork=i['images']())
-            
-            if imgfunc.image and imgfunc.func:
-                # For immediate response, try synchronous processing first
-                try:
-                    output = imgfunc.func(imgfunc.image)
-                    images[f'{i["method"]}image'] = output
-                    images[f'{i["method"]}image.original'] = imgfunc.image
-                    if use_winprops:
-                        imgfunc.set_properties(output)
-                except Exception as e:
-                    kodi_log(f'Image manipulation error for {i["method"]}: {e}', 2)
-                    # Queue for async processing as fallback
-                    _processing_queue.add_task(task_key, imgfunc.func, imgfunc.image)
+            method, imgfunc = futures[future]
+            output = imgfunc.finish(result)
+            key_image, key_original = _get_image_keys(method)
+            images[key_image] = output
+            images[key_original] = imgfunc.image
+            if use_winprops:
+                imgfunc.set_properties(output)
             
         return images
 
@@ -858,6 +1186,10 @@ def clear_image_caches():
     
     try:
         _smart_cache.clear()
+        _get_save_path.cache_clear()
+        _resolve_cached_thumbnail.cache_clear()
+        _list_thumbnail_files.cache_clear()
+        _cached_skin_has_image.cache_clear()
         
         with _processing_queue.lock:
             _processing_queue.completed.clear()
@@ -872,64 +1204,175 @@ def clear_image_caches():
         return False
 
 
+IMAGE_FILE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+IMAGE_STORAGE_DIRS = ('blur_v3', 'crop_v3', 'desaturate_v3', 'colors_v3')
+
+
+def _iter_image_files(img_dir):
+    """Yields (filepath, size) of images in img_dir - local directories are read with one scandir"""
+    local_dir = xbmcvfs.translatePath(img_dir)
+    if '://' not in local_dir:
+        with os.scandir(local_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(IMAGE_FILE_EXTENSIONS) or not entry.is_file(follow_symlinks=False):
+                    continue
+                yield os.path.join(img_dir, entry.name), entry.stat(follow_symlinks=False).st_size
+        return
+    dirs, files = xbmcvfs.listdir(img_dir)
+    for filename in files:
+        if not filename.lower().endswith(IMAGE_FILE_EXTENSIONS):
+            continue
+        filepath = os.path.join(img_dir, filename)
+        yield filepath, xbmcvfs.Stat(filepath).st_size()
+
+
+# One manifest of {filepath: size once optimized} instead of a marker per image - a regenerated file no longer matches its size
+OPTIMIZED_MANIFEST = f'{ADDONDATA}image_optimized.json'
+
+
+def _load_optimized_manifest():
+    try:
+        return json_loads(read_file(OPTIMIZED_MANIFEST)) or {}
+    except Exception:
+        return {}
+
+
+def _save_optimized_manifest(manifest):
+    try:
+        write_file(json_dumps(manifest), OPTIMIZED_MANIFEST)
+    except Exception as e:
+        kodi_log(f'Error saving image optimization manifest: {e}', 1)
+
+
+def _get_file_size(filepath):
+    local_path = xbmcvfs.translatePath(filepath)
+    if '://' not in local_path:
+        return os.path.getsize(local_path)
+    return xbmcvfs.Stat(filepath).st_size()
+
+
+# Native optimizers are rarely installed alongside Kodi so Pillow re-encoding remains the fallback
+_PNG_TOOL = shutil.which('oxipng')
+_JPG_TOOL = shutil.which('jpegoptim')
+
+
+def _get_optimizer_command(local_path):
+    """Command for the native optimizer matching the file content - stored names do not always match the format"""
+    with open(local_path, 'rb') as f:
+        magic = f.read(8)
+    if _PNG_TOOL and magic.startswith(b'\x89PNG'):
+        return [_PNG_TOOL, '-o2', '--strip', 'safe', '-q', local_path]
+    if _JPG_TOOL and magic.startswith(b'\xff\xd8'):
+        return [_JPG_TOOL, '--strip-all', '-m85', '-q', local_path]
+
+
+def _optimize_with_tool(filepath):
+    """Optimize in place with oxipng or jpegoptim without decoding in Python - returns False if unavailable or failed"""
+    if not _PNG_TOOL and not _JPG_TOOL:
+        return False
+    local_path = xbmcvfs.translatePath(filepath)
+    if '://' in local_path:
+        return False
+    try:
+        command = _get_optimizer_command(local_path)
+        if not command:
+            return False
+        return subprocess.run(command, timeout=30, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _optimize_stored_image(filepath):
+    """Re-encode a stored image with a native optimizer if installed or else with Pillow"""
+    if _optimize_with_tool(filepath):
+        return True
+    img = _imageopen(filepath)
+    if not img:
+        return False
+    try:
+        return _saveimage(img, filepath, optimize=True, final_output=True)
+    finally:
+        img.close()
+
+
+OPTIMIZE_BATCH_BUDGET = 0.05  # Seconds of work between yields
+
+
 def optimize_image_storage():
     """Background task to optimize stored images"""
     try:
-        image_dirs = [
-            f"{ADDONDATA}blur_v3/",
-            f"{ADDONDATA}crop_v3/", 
-            f"{ADDONDATA}desaturate_v3/",
-            f"{ADDONDATA}colors_v3/"
-        ]
-        
+        # Work on the translated path when ADDONDATA is on local disk so per-file calls skip the VFS layer
+        base_dir = xbmcvfs.translatePath(ADDONDATA)
+        if '://' not in base_dir:
+            present_dirs = {i for i in IMAGE_STORAGE_DIRS if os.path.isdir(os.path.join(base_dir, i))}
+        else:  # One listing of ADDONDATA answers which image folders exist
+            base_dir = ADDONDATA
+            present_dirs = set(xbmcvfs.listdir(ADDONDATA)[0])
+
         optimized_count = 0
-        for img_dir in image_dirs:
-            if not xbmcvfs.exists(img_dir):
-                continue
-                
-            dirs, files = xbmcvfs.listdir(img_dir)
-            for filename in files:
-                if not filename.lower().endswith(('.jpg', '.jpeg', '.png')):
+        monitor = Monitor()
+        batch_start = time.monotonic()
+        manifest = _load_optimized_manifest()
+        optimized = {}  # Rebuilt from the files still present so entries for deleted images are dropped
+        completed = False
+        try:
+            for image_dir in IMAGE_STORAGE_DIRS:
+                if image_dir not in present_dirs:
                     continue
-                    
-                filepath = os.path.join(img_dir, filename)
-                try:
-                    # Check if already optimized (smaller file size indicates compression)
-                    stat = xbmcvfs.Stat(filepath)
-                    if stat.st_size() < 50000:  # Already optimized if under 50KB
+                img_dir = os.path.join(base_dir, image_dir, '')
+
+                for filepath, file_size in _iter_image_files(img_dir):
+                    try:
+                        # Check if already optimized (smaller file size indicates compression)
+                        if file_size < 50000:  # Already optimized if under 50KB
+                            continue
+                        if manifest.get(filepath) == file_size:  # Handled in an earlier session and unchanged since
+                            optimized[filepath] = file_size
+                            continue
+
+                        # Re-optimize large images - failures are recorded too so they are not retried every session
+                        if _optimize_stored_image(filepath):
+                            optimized_count += 1
+                        optimized[filepath] = _get_file_size(filepath)
+
+                        # Don't block the system - yield once the batch has used its time budget and stop on shutdown
+                        if time.monotonic() - batch_start > OPTIMIZE_BATCH_BUDGET:
+                            if monitor.waitForAbort(0.01):
+                                return
+                            batch_start = time.monotonic()
+                        elif monitor.abortRequested():
+                            return
+
+                    except Exception as e:
+                        kodi_log(f'Error optimizing {filepath}: {e}', 1)
                         continue
-                        
-                    # Re-optimize large images
-                    img = _imageopen(filepath)
-                    if img:
-                        # Save with optimization
-                        _saveimage(img, filepath, optimize=True)
-                        img.close()
-                        optimized_count += 1
-                        
-                        # Don't block the system
-                        if optimized_count % 10 == 0:
-                            Monitor().waitForAbort(0.1)
-                            
-                except Exception as e:
-                    kodi_log(f'Error optimizing {filepath}: {e}', 1)
-                    continue
-        
+            completed = True
+        finally:
+            # An early stop keeps the entries for files it did not reach
+            _save_optimized_manifest(optimized if completed else {**manifest, **optimized})
+
         if optimized_count > 0:
             kodi_log(f'TMDbHelper: Optimized {optimized_count} images', 1)
-            
+
     except Exception as e:
         kodi_log(f'Error in image optimization task: {e}', 2)
 
 
-# Auto-start background optimization (run once per session)
+# Background optimization is opt-in and started by the service (run once per session)
 _optimization_started = False
-def _start_background_optimization():
+
+
+def start_background_optimization(delay=60):
+    """Run optimize_image_storage once after delay seconds so it stays clear of startup"""
     global _optimization_started
-    if not _optimization_started:
-        _optimization_started = True
-        thread = SafeThread(target=optimize_image_storage)
-        thread.start()
+    if _optimization_started:
+        return
+    _optimization_started = True
+
+    def _deferred():
+        if Monitor().waitForAbort(delay):
+            return
+        optimize_image_storage()
 
-# Initialize background optimization when module is imported
-_start_background_optimization()
\ No newline at end of file
+    thread = SafeThread(target=_deferred)
+    thread.start()
\ No newline at end of file